@@ -36,95 +36,47 @@ Example usage:
 """
 from __future__ import annotations
 
-# Core plugin infrastructure
-from osintbuddy.plugins import (
-    Registry,
-    Plugin,
-    transform,
-    load_plugins_fs,
-    TransformPayload,
-)
-
-# Result types for transforms
-from osintbuddy.results import (
-    Entity,
-    Edge,
-    File,
-    Subgraph,
-    normalize_result,
-)
-
-# JSON to Python compiler
-from osintbuddy.compiler import (
-    compile_entity,
-    compile_file,
-    compile_directory,
-)
-
-# Field types for type-based matching
-from osintbuddy.types import (
-    FieldType,
-    TypedValue,
-    get_field_type,
-    are_types_compatible,
-)
-
-# Settings for transforms
-from osintbuddy.settings import (
-    TransformSetting,
-    SettingsManager,
-    get_settings_manager,
-)
-
-# Transform sets for grouping
-from osintbuddy.sets import (
-    TransformSet,
-)
-
-# UI messages
-from osintbuddy.messages import (
-    UIMessage,
-    MessageType,
-    TransformResponse,
-)
-
-# Structured output
-from osintbuddy.output import (
-    emit_result,
-    emit_error,
-    emit_progress,
-    emit_json,
-    ProgressEmitter,
-    ProgressEvent,
-)
-
-# Error types
-from osintbuddy.errors import (
-    PluginError,
-    PluginWarn,
-    PluginNotFoundError,
-    TransformNotFoundError,
-    TransformCollisionError,
-    DependencyError,
-    ConfigError,
-    TransformTimeoutError,
-    NetworkError,
-    RateLimitError,
-    AuthError,
-    ErrorCode,
-)
-
-# Dependency management
-from osintbuddy.deps import (
-    ensure_deps,
-    check_deps,
-)
-from osintbuddy.utils import (
-    resolve_resource_path,
-    read_resource_text,
-    read_resource_json,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from osintbuddy.plugins import Registry, Plugin, transform, load_plugins_fs, TransformPayload
+    from osintbuddy.results import Entity, Edge, File, Subgraph, RawJSON, normalize_result
+    from osintbuddy.compiler import compile_entity, compile_file, compile_directory
+    from osintbuddy.types import FieldType, TypedValue, get_field_type, are_types_compatible
+    from osintbuddy.settings import TransformSetting, SettingsManager, get_settings_manager
+    from osintbuddy.sets import TransformSet
+    from osintbuddy.messages import UIMessage, MessageType, TransformResponse
+    from osintbuddy.output import (
+        emit_result,
+        emit_result_stream,
+        emit_result_astream,
+        emit_error,
+        emit_progress,
+        flush_progress,
+        emit_json,
+        ProgressEmitter,
+        ProgressEvent,
+    )
+    from osintbuddy.errors import (
+        PluginError,
+        PluginWarn,
+        PluginNotFoundError,
+        TransformNotFoundError,
+        TransformCollisionError,
+        DependencyError,
+        ConfigError,
+        TransformTimeoutError,
+        NetworkError,
+        RateLimitError,
+        AuthError,
+        ErrorCode,
+    )
+    from osintbuddy.deps import ensure_deps, check_deps
+    from osintbuddy.utils import resolve_resource_path, read_resource_text, read_resource_json
 
+# flit reads this literal for the distribution version (dynamic = ["version"]),
+# so it must stay a plain string rather than an importlib.metadata lookup.
 __version__ = "2.0.0"
 
 __all__ = [
@@ -141,6 +93,7 @@ __all__ = [
     "Edge",
     "File",
     "Subgraph",
+    "RawJSON",
     "normalize_result",
     # Compiler
     "compile_entity",
@@ -163,8 +116,11 @@ __all__ = [
     "TransformResponse",
     # Output
     "emit_result",
+    "emit_result_stream",
+    "emit_result_astream",
     "emit_error",
     "emit_progress",
+    "flush_progress",
     "emit_json",
     "ProgressEmitter",
     "ProgressEvent",
@@ -189,3 +145,86 @@ __all__ = [
     "read_resource_text",
     "read_resource_json",
 ]
+
+# Public name -> defining module. Submodules are imported on first attribute
+# access (PEP 562) so `import osintbuddy` stays cheap for callers that only
+# need a single symbol, e.g. `__version__` during `ob --help`.
+_LAZY: dict[str, str] = {
+    # Core
+    "Registry": "osintbuddy.plugins",
+    "Plugin": "osintbuddy.plugins",
+    "transform": "osintbuddy.plugins",
+    "load_plugins_fs": "osintbuddy.plugins",
+    "TransformPayload": "osintbuddy.plugins",
+    # Results
+    "Entity": "osintbuddy.results",
+    "Edge": "osintbuddy.results",
+    "File": "osintbuddy.results",
+    "Subgraph": "osintbuddy.results",
+    "RawJSON": "osintbuddy.results",
+    "normalize_result": "osintbuddy.results",
+    # Compiler
+    "compile_entity": "osintbuddy.compiler",
+    "compile_file": "osintbuddy.compiler",
+    "compile_directory": "osintbuddy.compiler",
+    # Types
+    "FieldType": "osintbuddy.types",
+    "TypedValue": "osintbuddy.types",
+    "get_field_type": "osintbuddy.types",
+    "are_types_compatible": "osintbuddy.types",
+    # Settings
+    "TransformSetting": "osintbuddy.settings",
+    "SettingsManager": "osintbuddy.settings",
+    "get_settings_manager": "osintbuddy.settings",
+    # Sets
+    "TransformSet": "osintbuddy.sets",
+    # Messages
+    "UIMessage": "osintbuddy.messages",
+    "MessageType": "osintbuddy.messages",
+    "TransformResponse": "osintbuddy.messages",
+    # Output
+    "emit_result": "osintbuddy.output",
+    "emit_result_stream": "osintbuddy.output",
+    "emit_result_astream": "osintbuddy.output",
+    "emit_error": "osintbuddy.output",
+    "emit_progress": "osintbuddy.output",
+    "flush_progress": "osintbuddy.output",
+    "emit_json": "osintbuddy.output",
+    "ProgressEmitter": "osintbuddy.output",
+    "ProgressEvent": "osintbuddy.output",
+    # Errors
+    "PluginError": "osintbuddy.errors",
+    "PluginWarn": "osintbuddy.errors",
+    "PluginNotFoundError": "osintbuddy.errors",
+    "TransformNotFoundError": "osintbuddy.errors",
+    "TransformCollisionError": "osintbuddy.errors",
+    "DependencyError": "osintbuddy.errors",
+    "ConfigError": "osintbuddy.errors",
+    "TransformTimeoutError": "osintbuddy.errors",
+    "NetworkError": "osintbuddy.errors",
+    "RateLimitError": "osintbuddy.errors",
+    "AuthError": "osintbuddy.errors",
+    "ErrorCode": "osintbuddy.errors",
+    # Deps
+    "ensure_deps": "osintbuddy.deps",
+    "check_deps": "osintbuddy.deps",
+    # Resources
+    "resolve_resource_path": "osintbuddy.utils",
+    "read_resource_text": "osintbuddy.utils",
+    "read_resource_json": "osintbuddy.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public symbol from its submodule on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
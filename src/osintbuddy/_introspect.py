@@ -0,0 +1,167 @@
+"""Plugin and transform metadata shared by the CLI and the IPC worker.
+
+Kept free of the plugin framework's imports, so the CLI's cached listing
+commands can use it without loading pydantic or the plugins.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from functools import lru_cache
+from typing import Any
+
+
+def iso8601(ts: float) -> str:
+    """Format a Unix timestamp as UTC ISO 8601, e.g. 2024-01-31T12:00:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+def last_edit(ts: float) -> str:
+    """Format a plugin file's mtime the way entity listings show it."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts))
+
+
+def module_stats(paths: list[str]) -> dict[str, os.stat_result | None]:
+    """Stat plugin module files with one os.scandir per directory.
+
+    DirEntry.stat() comes straight from the listing on Windows and costs a
+    single stat elsewhere. The result is in ``paths`` order; files that
+    can't be found map to None.
+    """
+    by_dir: dict[str, dict[str, str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), {})[os.path.basename(path)] = path
+
+    found: dict[str, os.stat_result] = {}
+    for dirpath, files in by_dir.items():
+        try:
+            with os.scandir(dirpath or ".") as it:
+                for entry in it:
+                    wanted = files.get(entry.name)
+                    if wanted is not None:
+                        try:
+                            found[wanted] = entry.stat()
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+    return {path: found.get(path) for path in paths}
+
+
+def _read_file(path: str) -> str:
+    with open(path) as fh:
+        return fh.read()
+
+
+@lru_cache(maxsize=256)
+def _read_cached(path: str, mtime_ns: int) -> str:
+    # mtime_ns is only part of the key, so an edited file misses
+    return _read_file(path)
+
+
+def read_source(path: str, mtime_ns: int | None) -> str:
+    """Read a plugin module's source, cached while its mtime_ns is unchanged.
+
+    Without an mtime (the stat failed) there is nothing to invalidate a
+    cache entry by, so the file is read directly.
+    """
+    if mtime_ns is None:
+        return _read_file(path)
+    return _read_cached(path, mtime_ns)
+
+
+def _cache_on(fn: Any, attr: str, value: dict[str, Any]) -> dict[str, Any]:
+    try:
+        setattr(fn, attr, value)
+    except (AttributeError, TypeError):
+        pass
+    return value
+
+
+def transform_brief(fn: Any) -> dict[str, Any]:
+    """Label/icon/edge_label of a transform, built once and kept on the function."""
+    brief = getattr(fn, "_ob_brief", None)
+    if brief is None:
+        label = getattr(fn, "label", "unknown")
+        brief = _cache_on(fn, "_ob_brief", {
+            "label": label,
+            "icon": getattr(fn, "icon", "list"),
+            "edge_label": getattr(fn, "edge_label", label),
+        })
+    return brief
+
+
+def transform_info(fn: Any) -> dict[str, Any]:
+    """Full transform listing entry, built once and kept on the function.
+
+    The dict is shared between callers, so don't modify it.
+    """
+    info = getattr(fn, "_ob_info", None)
+    if info is None:
+        info = dict(transform_brief(fn))
+        if deps := getattr(fn, "deps", None):
+            info["deps"] = deps
+        if accepts := getattr(fn, "accepts", None):
+            info["accepts"] = accepts
+        if produces := getattr(fn, "produces", None):
+            info["produces"] = produces
+        if settings := getattr(fn, "settings", None):
+            info["settings"] = [
+                {"name": s.name, "display_name": s.display_name, "required": s.required}
+                for s in settings
+            ]
+        info = _cache_on(fn, "_ob_info", info)
+    return info
+
+
+class PluginInfo:
+    """Plugin metadata resolved once per class, read by every listing."""
+
+    __slots__ = (
+        "label", "entity_id", "version", "author", "description",
+        "category", "tags", "module_file",
+    )
+
+    def __init__(self, plugin_cls: type) -> None:
+        from osintbuddy.utils import to_snake_case
+
+        self.label = getattr(plugin_cls, "label", "unknown")
+        self.entity_id = getattr(plugin_cls, "entity_id", None) or to_snake_case(self.label)
+        self.version = getattr(plugin_cls, "version", "0")
+        self.author = getattr(plugin_cls, "author", "Unknown author")
+        self.description = getattr(plugin_cls, "description", "No description found...")
+        self.category = getattr(plugin_cls, "category", "")
+        self.tags = getattr(plugin_cls, "tags", [])
+        self.module_file = f"{sys.modules[plugin_cls.__module__].__file__}"
+
+
+# Plugin class -> its resolved metadata; cleared with the registry
+_plugin_infos: dict[type, PluginInfo] = {}
+
+
+def plugin_info(plugin_cls: type) -> PluginInfo:
+    """Get a plugin class's PluginInfo, resolving it on first use."""
+    # Keyed by the class itself, so subclasses never share a parent's info
+    info = _plugin_infos.get(plugin_cls)
+    if info is None:
+        info = _plugin_infos[plugin_cls] = PluginInfo(plugin_cls)
+    return info
+
+
+def clear_plugin_infos() -> None:
+    """Forget every resolved PluginInfo; call when the registry is cleared."""
+    _plugin_infos.clear()
+
+
+def plugin_instance(instances: dict[type, Any], plugin_cls: type) -> Any:
+    """Instantiate a plugin, reusing one instance for ``reusable`` plugins.
+
+    ``instances`` holds the reused instances and belongs to the caller.
+    """
+    if not getattr(plugin_cls, "reusable", False):
+        return plugin_cls()
+    instance = instances.get(plugin_cls)
+    if instance is None:
+        instance = instances[plugin_cls] = plugin_cls()
+    return instance
@@ -1,8 +1,8 @@
 """Display utilities for OSINTBuddy CLI."""
 from __future__ import annotations
 
-import random
-import time
+import os
+from datetime import datetime
 from typing import Any
 
 from rich.panel import Panel
@@ -26,20 +26,22 @@ BANNER = r"""
                                                             |___/
 """
 
+# The banner never changes, so style it once rather than on every print
+_BANNER_TEXT = Text(BANNER, style="cyan")
+_READY_LINE = f"[header]osintbuddy[/] [version]v{__version__}[/] [success]ready[/]"
+_SESSION_LINE = "[muted]session[/] {session_id}  [muted]start[/] {timestamp}"
+
 
 def print_banner(show_session: bool = True) -> None:
     """Print the OSINTBuddy banner with session info."""
-    console.print(Text(BANNER, style="cyan"))
-    console.print(
-        f"[header]osintbuddy[/] [version]v{__version__}[/] [success]ready[/]"
-    )
+    console.print(_BANNER_TEXT)
+    console.print(_READY_LINE)
 
     if show_session:
-        session_id = f"{random.randint(1000, 9999)}-{random.randint(100, 999)}"
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        console.print(
-            f"[muted]session[/] {session_id}  [muted]start[/] {timestamp}"
-        )
+        seed = int.from_bytes(os.urandom(4))
+        session_id = f"{1000 + seed % 9000}-{100 + (seed >> 16) % 900}"
+        timestamp = datetime.now().isoformat(" ", "seconds")
+        console.print(_SESSION_LINE.format(session_id=session_id, timestamp=timestamp))
         console.print("[muted]mode[/] local  [muted]operator[/] cli")
     console.print()
 
@@ -50,6 +52,7 @@ def print_error(
     code: str | None = None,
     details: dict[str, Any] | None = None,
     show_traceback: bool = False,
+    show_locals: bool = False,
 ) -> None:
     """Print a formatted error message.
 
@@ -58,6 +61,8 @@ def print_error(
         code: Optional error code
         details: Optional additional details
         show_traceback: If True, show the full traceback
+        show_locals: If True, include local variables in the traceback
+            (repr()s every local in every frame, so slow on deep stacks)
     """
     error_text = Text()
     error_text.append("ERROR", style="bold red")
@@ -72,7 +77,7 @@ def print_error(
             err_console.print(f"  [muted]{key}:[/] {value}")
 
     if show_traceback:
-        err_console.print(Traceback(show_locals=True))
+        err_console.print(Traceback(show_locals=show_locals, max_frames=20))
 
 
 def print_syntax_error(
@@ -131,6 +136,28 @@ def print_json_result(data: Any, title: str = "Result") -> None:
     console.print(Panel(syntax, title=title, border_style="cyan"))
 
 
+def _entity_row(entity: dict) -> tuple[str, str, str, str]:
+    """Normalize an entity dict into (label, category, author, description) cells."""
+    author = entity.get("author")
+    if isinstance(author, list):
+        author = ", ".join(author)
+
+    category = entity.get("category")
+    if isinstance(category, list):
+        category = ", ".join(str(cat) for cat in category if cat)
+
+    description = entity.get("description") or ""
+    if len(description) > 50:
+        description = description[:50] + "..."
+
+    return (
+        entity.get("label", "unknown"),
+        category or "-",
+        author or "unknown",
+        description or "-",
+    )
+
+
 def print_entities_table(entities: list[dict]) -> None:
     """Print entities in a formatted table."""
     table = Table(title="Entities", border_style="cyan")
@@ -139,23 +166,8 @@ def print_entities_table(entities: list[dict]) -> None:
     table.add_column("Author", style="muted")
     table.add_column("Description", style="dim", max_width=50)
 
-    for entity in entities:
-        author = entity.get("author", "unknown")
-        if isinstance(author, list):
-            author = ", ".join(author)
-        description = entity.get("description", "") or ""
-        desc_display = description[:50] + "..." if len(description) > 50 else (description or "-")
-        category = entity.get("category", "-")
-        if isinstance(category, list):
-            category_display = ", ".join(str(cat) for cat in category if cat) or "-"
-        else:
-            category_display = category or "-"
-        table.add_row(
-            entity.get("label", "unknown"),
-            category_display,
-            author or "unknown",
-            desc_display,
-        )
+    for row in map(_entity_row, entities):
+        table.add_row(*row)
 
     console.print(table)
 
@@ -32,6 +32,10 @@ class OSIBLogHandler(RichHandler):
         )
 
 
+# Handler installed by setup_logging, None until the first call
+_handler: OSIBLogHandler | None = None
+
+
 def setup_logging(
     level: int = logging.INFO,
     *,
@@ -47,26 +51,24 @@ def setup_logging(
 
     Returns:
         Configured logger
+
+    The handler is installed on the root logger only once per process;
+    later calls just update the level. Handlers added by other libraries
+    are left in place.
     """
-    # Remove any existing handlers
+    global _handler
     root = logging.getLogger()
-    for handler in root.handlers[:]:
-        root.removeHandler(handler)
-
-    # Configure Rich handler
-    handler = OSIBLogHandler(
-        show_path=show_path,
-        show_time=show_time,
-    )
-    handler.setLevel(level)
-
-    # Set format
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[handler],
-    )
+
+    if _handler is None:
+        _handler = OSIBLogHandler(
+            show_path=show_path,
+            show_time=show_time,
+        )
+        _handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+        root.addHandler(_handler)
+
+    _handler.setLevel(level)
+    root.setLevel(level)
 
     return logging.getLogger("osintbuddy")
 
@@ -83,30 +85,35 @@ def get_logger(name: str = "osintbuddy") -> logging.Logger:
     return logging.getLogger(name)
 
 
+class _CaptureHandler(logging.Handler):
+    """Handler that appends every record to a shared list."""
+
+    def __init__(self, records: list[logging.LogRecord]):
+        super().__init__()
+        self.records = records
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
 class LogCapture:
     """Context manager to capture log output."""
 
     def __init__(self, logger_name: str = "osintbuddy"):
         self.logger_name = logger_name
         self.records: list[logging.LogRecord] = []
+        self._logger: logging.Logger | None = None
         self._handler: logging.Handler | None = None
 
     def __enter__(self) -> "LogCapture":
-        class CaptureHandler(logging.Handler):
-            def __init__(self, records: list):
-                super().__init__()
-                self.records = records
-
-            def emit(self, record: logging.LogRecord) -> None:
-                self.records.append(record)
-
-        self._handler = CaptureHandler(self.records)
-        logging.getLogger(self.logger_name).addHandler(self._handler)
+        self._logger = logging.getLogger(self.logger_name)
+        self._handler = _CaptureHandler(self.records)
+        self._logger.addHandler(self._handler)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._handler:
-            logging.getLogger(self.logger_name).removeHandler(self._handler)
+        if self._logger and self._handler:
+            self._logger.removeHandler(self._handler)
 
     def get_messages(self, level: int | None = None) -> list[str]:
         """Get captured messages.
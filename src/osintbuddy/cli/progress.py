@@ -15,6 +15,9 @@ from osintbuddy.cli.console import console
 
 SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
+# Live refresh rate; animations never push updates faster than this
+FRAME_RATE = 20
+
 
 @dataclass
 class Step:
@@ -26,18 +29,25 @@ class Step:
     tick_count: int = 20
 
 
-def _progress_bar(percent: int, width: int = 20) -> str:
+_BAR_WIDTH = 20
+
+# Every possible default-width bar, indexed by filled cell count
+_BARS = ["[" + "█" * i + "░" * (_BAR_WIDTH - i) + "]" for i in range(_BAR_WIDTH + 1)]
+
+
+def _progress_bar(percent: int, width: int = _BAR_WIDTH) -> str:
     """Generate an ASCII progress bar."""
     filled = int(width * percent / 100)
+    if width == _BAR_WIDTH and 0 <= filled <= _BAR_WIDTH:
+        return _BARS[filled]
     return "[" + "█" * filled + "░" * (width - filled) + "]"
 
 
-def _render(lines: list[str], active_line: str | None = None) -> Group:
-    """Render lines as a Group."""
-    renderables = [Text.from_markup(line) for line in lines]
-    if active_line:
-        renderables.append(Text.from_markup(active_line))
-    return Group(*renderables)
+def _render(lines: list[Text], active_line: Text | None = None) -> Group:
+    """Render pre-parsed lines as a Group."""
+    if active_line is not None:
+        return Group(*lines, active_line)
+    return Group(*lines)
 
 
 class StepRunner:
@@ -50,16 +60,25 @@ class StepRunner:
             speed: Animation speed multiplier (lower = faster)
         """
         self.speed = speed
-        self.lines: list[str] = []
+        self.lines: list[Text] = []
 
     def type_command(self, live: Live, prompt: str, command: str) -> None:
         """Animate typing a command."""
-        typed = ""
-        for ch in command:
-            typed += ch
-            live.update(_render(self.lines, f"{prompt}{typed}"))
-            time.sleep(0.015 * self.speed)
-        self.lines.append(f"{prompt}{command}")
+        prompt_text = Text.from_markup(prompt)
+        char_delay = 0.015 * self.speed
+        # Reveal as many characters per update as fit in one refresh frame
+        if char_delay > 0:
+            chars_per_frame = max(1, int(1 / (FRAME_RATE * char_delay)))
+        else:
+            chars_per_frame = max(1, len(command))
+        frame_delay = chars_per_frame * char_delay
+
+        deadline = time.monotonic()
+        for end in range(chars_per_frame, len(command) + chars_per_frame, chars_per_frame):
+            live.update(_render(self.lines, Text.assemble(prompt_text, command[:end])))
+            deadline += frame_delay
+            time.sleep(max(0.0, deadline - time.monotonic()))
+        self.lines.append(Text.assemble(prompt_text, command))
 
     def run_step(self, live: Live, step: Step) -> None:
         """Run an animated step with progress bar."""
@@ -67,55 +86,110 @@ class StepRunner:
         out_idx = 0
         start = time.time()
 
+        # Parse the static parts of the active line once; only the spinner,
+        # bar and percentage change between ticks.
+        name_text = Text.from_markup(f"[cyan]>> {step.name}[/] ")
+        hint_text = Text.from_markup(f" [dim]{step.hint}[/]")
+
         for tick in range(step.tick_count):
             percent = int(100 * (tick + 1) / step.tick_count)
             spinner = SPINNER_FRAMES[tick % len(SPINNER_FRAMES)]
             bar = _progress_bar(percent)
 
-            active = (
-                f"[cyan]>> {step.name}[/] {spinner} {bar} "
-                f"[yellow]{percent}%[/] [dim]{step.hint}[/]"
+            active = Text.assemble(
+                name_text,
+                f"{spinner} {bar} ",
+                (f"{percent}%", "yellow"),
+                hint_text,
             )
 
             if (tick + 1) % reveal_every == 0 and out_idx < len(step.outputs):
-                self.lines.append(f"   [dim]-[/] {step.outputs[out_idx]}")
+                self.lines.append(Text.from_markup(f"   [dim]-[/] {step.outputs[out_idx]}"))
                 out_idx += 1
 
             live.update(_render(self.lines, active))
             time.sleep(0.03 * self.speed)
 
         elapsed_ms = int((time.time() - start) * 1000)
-        self.lines.append(f"[green]>> {step.name}[/] [success]OK[/] [dim]{elapsed_ms}ms[/]")
+        self.lines.append(
+            Text.from_markup(f"[green]>> {step.name}[/] [success]OK[/] [dim]{elapsed_ms}ms[/]")
+        )
 
     def run_steps(self, steps: list[Step], header_lines: list[str] | None = None) -> None:
         """Run multiple steps with animation."""
-        self.lines = header_lines or []
+        self.lines = [Text.from_markup(line) for line in header_lines or []]
 
-        with Live(_render(self.lines), console=console, refresh_per_second=20) as live:
+        with Live(_render(self.lines), console=console, refresh_per_second=FRAME_RATE) as live:
             for step in steps:
                 self.run_step(live, step)
-                self.lines.append("")
+                self.lines.append(Text())
 
             live.update(_render(self.lines))
             time.sleep(0.3 * self.speed)
 
 
+class _SharedProgress:
+    """A lazily built Progress display shared by every context using it.
+
+    The display is started when the first task is added and stopped once
+    the last active context exits, so nested or back-to-back contexts do
+    not rebuild columns or the live renderer each time.
+    """
+
+    def __init__(self, factory: Callable[[], Progress]):
+        self._factory = factory
+        self._progress: Progress | None = None
+        self._active = 0
+
+    def acquire(self) -> Progress:
+        """Return the shared Progress, starting it if idle."""
+        if self._progress is None:
+            self._progress = self._factory()
+        if self._active == 0:
+            self._progress.start()
+        self._active += 1
+        return self._progress
+
+    def release(self) -> None:
+        """Stop the display and drop finished tasks once nothing is active."""
+        if self._progress is None or self._active == 0:
+            return
+        self._active -= 1
+        if self._active == 0:
+            self._progress.stop()
+            for task_id in list(self._progress.task_ids):
+                self._progress.remove_task(task_id)
+
+
+_transform_progress = _SharedProgress(
+    lambda: Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(bar_width=30),
+        TaskProgressColumn(),
+        console=console,
+    )
+)
+
+_plugin_load_progress = _SharedProgress(
+    lambda: Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+)
+
+
 class TransformProgress:
     """Progress display for transform execution."""
 
     def __init__(self, transform_label: str):
         self.transform_label = transform_label
-        self.progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=30),
-            TaskProgressColumn(),
-            console=console,
-        )
+        self.progress: Progress
         self.task_id = None
 
     def __enter__(self) -> "TransformProgress":
-        self.progress.start()
+        self.progress = _transform_progress.acquire()
         self.task_id = self.progress.add_task(
             f"[cyan]Running {self.transform_label}[/]",
             total=100,
@@ -125,7 +199,7 @@ class TransformProgress:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         if exc_type is None:
             self.progress.update(self.task_id, completed=100)
-        self.progress.stop()
+        _transform_progress.release()
 
     def update(self, message: str, percent: int) -> None:
         """Update progress."""
@@ -140,19 +214,15 @@ class PluginLoadProgress:
     """Progress display for plugin loading."""
 
     def __init__(self):
-        self.progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        )
+        self.progress: Progress
 
     def __enter__(self) -> "PluginLoadProgress":
-        self.progress.start()
+        self.progress = _plugin_load_progress.acquire()
         self.task = self.progress.add_task("[cyan]Loading plugins...[/]")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self.progress.stop()
+        _plugin_load_progress.release()
 
     def update(self, message: str) -> None:
         """Update status message."""
@@ -37,11 +37,23 @@ Example output:
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from json.encoder import encode_basestring as _quote_str
 from typing import Any
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads  # type: ignore[assignment]
+
 
 # Map JSON element types to Python class names
 ELEMENT_TYPE_MAP = {
@@ -66,236 +78,417 @@ ELEMENT_TYPE_MAP = {
 }
 
 # Which classes are inputs vs displays
-INPUT_CLASSES = {"TextInput", "TextAreaInput", "DropdownInput", "UploadFileInput"}
-DISPLAY_CLASSES = {"Title", "Text", "CopyText", "CopyCode", "Json", "Image", "Video", "Pdf", "List", "Table", "Empty"}
+INPUT_CLASSES = frozenset({"TextInput", "TextAreaInput", "DropdownInput", "UploadFileInput"})
+DISPLAY_CLASSES = frozenset({"Title", "Text", "CopyText", "CopyCode", "Json", "Image", "Video", "Pdf", "List", "Table", "Empty"})
+
+# Order of names in the generated element import: inputs, then displays, each sorted
+_IMPORT_ORDER = tuple(sorted(INPUT_CLASSES)) + tuple(sorted(DISPLAY_CLASSES))
+
 
+# Generated source keyed by a digest of (entity definition, version)
+_COMPILE_CACHE: dict[str, str] = {}
+_COMPILE_CACHE_MAX = 512
+
+# compile_directory compiles fewer files than this serially
+_PARALLEL_COMPILE_MIN = 4
+
+# Word separators for class names
+_SPLIT_RE = re.compile(r'[\s_-]+')
 
 def to_pascal_case(label: str) -> str:
     """Convert a label to PascalCase for class names."""
     # Remove non-alphanumeric characters, split on spaces/underscores
-    words = re.split(r'[\s_-]+', label)
+    words = _SPLIT_RE.split(label)
     return ''.join(word.capitalize() for word in words if word)
 
 
-def format_value(value: Any, indent: str = "") -> str:
-    """Format a Python value for code generation."""
+@lru_cache(maxsize=4096, typed=True)
+def _format_scalar(value: str | int | float | bool | None) -> str:
+    """Format a scalar value, cached since labels, icons and keys repeat a lot.
+
+    ``typed=True`` keeps ``True``, ``1`` and ``1.0`` from sharing an entry.
+    """
     if value is None:
         return "None"
     if isinstance(value, bool):
         return "True" if value else "False"
     if isinstance(value, str):
-        # Escape quotes and newlines
-        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
-        return f'"{escaped}"'
-    if isinstance(value, (int, float)):
-        return str(value)
-    if isinstance(value, list):
-        if not value:
-            return "[]"
-        # Check if it's a simple list (no dicts) or complex
-        if all(isinstance(v, (str, int, float, bool)) for v in value):
-            items = ", ".join(format_value(v) for v in value)
-            return f"[{items}]"
+        # The C JSON string encoder: one pass, quotes included, and its
+        # escapes (\\, \", \n, \t, \uXXXX, ...) are valid Python literals
+        return _quote_str(value)
+    return str(value)
+
+
+def _emit_scalar(value: Any, out: list[str], indent: str = "") -> None:
+    out.append(_format_scalar(value))
+
+
+def _emit_list(value: list, out: list[str], indent: str = "") -> None:
+    if not value:
+        out.append("[]")
+    # Check if it's a simple list (no dicts) or complex
+    elif all(isinstance(v, (str, int, float, bool)) for v in value):
+        out.append("[")
+        for i, v in enumerate(value):
+            if i:
+                out.append(", ")
+            _emit_value(v, out)
+        out.append("]")
+    else:
         # Complex list (e.g., options with dicts) - format on multiple lines
-        lines = ["["]
+        item_indent = indent + "    "
+        out.append("[\n")
         for v in value:
-            lines.append(f"{indent}    {format_value(v, indent + '    ')},")
-        lines.append(f"{indent}]")
-        return "\n".join(lines)
-    if isinstance(value, dict):
-        if not value:
-            return "{}"
-        items = ", ".join(f"{format_value(k)}: {format_value(v)}" for k, v in value.items())
-        return f"{{{items}}}"
-    return repr(value)
+            out.append(item_indent)
+            _emit_value(v, out, item_indent)
+            out.append(",\n")
+        out.append(f"{indent}]")
+
+
+def _emit_dict(value: dict, out: list[str], indent: str = "") -> None:
+    if not value:
+        out.append("{}")
+        return
+    out.append("{")
+    for i, (k, v) in enumerate(value.items()):
+        if i:
+            out.append(", ")
+        _emit_value(k, out)
+        out.append(": ")
+        _emit_value(v, out)
+    out.append("}")
+
+
+def _emit_repr(value: Any, out: list[str], indent: str = "") -> None:
+    out.append(repr(value))
+
+
+# Emitters keyed on exact type, which covers everything json.loads produces
+_EMITTERS = {
+    str: _emit_scalar,
+    int: _emit_scalar,
+    float: _emit_scalar,
+    bool: _emit_scalar,
+    type(None): _emit_scalar,
+    list: _emit_list,
+    dict: _emit_dict,
+}
 
 
-def format_options(options: list, base_indent: str) -> str:
-    """Format dropdown options with proper indentation."""
+def _emit_value(value: Any, out: list[str], indent: str = "") -> None:
+    """Append the Python source for a value to ``out``."""
+    emitter = _EMITTERS.get(type(value))
+    if emitter is None:
+        # Subclasses (str enums such as FieldType, OrderedDict, ...)
+        if isinstance(value, (str, int, float)):
+            emitter = _emit_scalar
+        elif isinstance(value, list):
+            emitter = _emit_list
+        elif isinstance(value, dict):
+            emitter = _emit_dict
+        else:
+            emitter = _emit_repr
+    emitter(value, out, indent)
+
+
+def _emit_options(options: list, out: list[str], base_indent: str) -> None:
+    """Append dropdown options with proper indentation to ``out``."""
     if not options:
-        return "[]"
+        out.append("[]")
+        return
 
-    lines = ["["]
+    out.append("[\n")
     for opt in options:
-        lines.append(f"{base_indent}    {format_value(opt)},")
-    lines.append(f"{base_indent}]")
-    return "\n".join(lines)
+        out.append(f"{base_indent}    ")
+        _emit_value(opt, out)
+        out.append(",\n")
+    out.append(f"{base_indent}]")
 
 
-def generate_element_code(element: dict, base_indent: str = "        ") -> tuple[str, bool]:
-    """Generate Python code for a single element.
+def _emit_element(
+    element: dict,
+    out: list[str],
+    base_indent: str = "        ",
+    used: set[str] | None = None,
+) -> bool:
+    """Append the constructor call for a single element to ``out``.
+
+    If ``used`` is given, the element's class name is added to it.
 
     Returns:
-        Tuple of (code_string, is_multiline)
+        True if the call spans multiple lines
     """
     element_type = element.get("type", "text")
     class_name = ELEMENT_TYPE_MAP.get(element_type, "TextInput")
+    if used is not None:
+        used.add(class_name)
 
-    # Build kwargs for the element constructor
-    kwargs = []
-    has_options = False
+    out.append(f"{class_name}(")
+    sep = ""
 
     # Label is always first
     if label := element.get("label"):
-        kwargs.append(f'label={format_value(label)}')
+        out.append("label=")
+        _emit_value(label, out)
+        sep = ", "
 
     # Icon
     if icon := element.get("icon"):
-        kwargs.append(f'icon={format_value(icon)}')
+        out.append(f"{sep}icon=")
+        _emit_value(icon, out)
+        sep = ", "
 
     # Field type (for type-based transform matching)
     if field_type := element.get("field_type"):
-        # Use FieldType enum if it matches a known type
-        kwargs.append(f'field_type={format_value(field_type)}')
+        out.append(f"{sep}field_type=")
+        _emit_value(field_type, out)
+        sep = ", "
 
     # Value (for inputs)
     if "value" in element and element["value"]:
-        kwargs.append(f'value={format_value(element["value"])}')
+        out.append(f"{sep}value=")
+        _emit_value(element["value"], out)
+        sep = ", "
 
     # Width
     if width := element.get("width"):
-        kwargs.append(f'width={width}')
+        out.append(f"{sep}width={width}")
+        sep = ", "
 
     # Options (for dropdowns) - needs special formatting
+    has_options = False
     if options := element.get("options"):
         has_options = True
-        options_str = format_options(options, base_indent)
-        kwargs.append(f'options={options_str}')
+        out.append(f"{sep}options=")
+        _emit_options(options, out, base_indent)
+        sep = ", "
 
     # Placeholder
     if placeholder := element.get("placeholder"):
-        kwargs.append(f'placeholder={format_value(placeholder)}')
+        out.append(f"{sep}placeholder=")
+        _emit_value(placeholder, out)
 
-    if has_options:
-        # Multi-line format for elements with options
-        kwargs_str = ", ".join(kwargs)
-        return f"{class_name}({kwargs_str})", True
-    else:
-        kwargs_str = ", ".join(kwargs)
-        return f"{class_name}({kwargs_str})", False
+    out.append(")")
+    return has_options
 
 
-def generate_elements_code(elements: list, indent: str = "        ") -> str:
-    """Generate Python code for the elements list."""
+def _emit_elements(
+    elements: list,
+    out: list[str],
+    indent: str = "        ",
+    used: set[str] | None = None,
+) -> None:
+    """Append the elements list literal to ``out``, collecting class names into ``used``."""
     if not elements:
-        return "[]"
+        out.append("[]")
+        return
 
-    lines = ["["]
+    # Loop invariants, hoisted out of the per-element loop
+    append = out.append
+    row_indent = indent + "    "
+    single_row_open = f"{indent}["
+    row_open = f"{indent}[\n"
+    row_close = f"{indent}],\n"
 
-    for i, element in enumerate(elements):
+    append("[\n")
+    for element in elements:
         if isinstance(element, list):
             # Row of elements (grouped in same row)
             if len(element) == 1:
-                elem_code, _ = generate_element_code(element[0], indent)
-                lines.append(f"{indent}[{elem_code}],")
+                append(single_row_open)
+                _emit_element(element[0], out, indent, used)
+                append("],\n")
             else:
-                lines.append(f"{indent}[")
-                for j, elem in enumerate(element):
-                    elem_code, is_multiline = generate_element_code(elem, indent + "    ")
-                    lines.append(f"{indent}    {elem_code},")
-                lines.append(f"{indent}],")
+                append(row_open)
+                for elem in element:
+                    append(row_indent)
+                    _emit_element(elem, out, row_indent, used)
+                    append(",\n")
+                append(row_close)
         else:
             # Single element (own row)
-            elem_code, _ = generate_element_code(element, indent)
-            lines.append(f"{indent}{elem_code},")
+            append(indent)
+            _emit_element(element, out, indent, used)
+            append(",\n")
+    append("    ]")
+
+
+def format_value(value: Any, indent: str = "") -> str:
+    """Format a Python value for code generation."""
+    out: list[str] = []
+    _emit_value(value, out, indent)
+    return "".join(out)
+
+
+def format_options(options: list, base_indent: str) -> str:
+    """Format dropdown options with proper indentation."""
+    out: list[str] = []
+    _emit_options(options, out, base_indent)
+    return "".join(out)
+
+
+def generate_element_code(element: dict, base_indent: str = "        ") -> tuple[str, bool]:
+    """Generate Python code for a single element.
+
+    Returns:
+        Tuple of (code_string, is_multiline)
+    """
+    out: list[str] = []
+    is_multiline = _emit_element(element, out, base_indent)
+    return "".join(out), is_multiline
 
-    lines.append(f"    ]")
-    return "\n".join(lines)
+
+def generate_elements_code(elements: list, indent: str = "        ") -> str:
+    """Generate Python code for the elements list."""
+    out: list[str] = []
+    _emit_elements(elements, out, indent)
+    return "".join(out)
 
 
-def compile_entity(entity_json: dict | str, version: str = "1.0.0") -> str:
+def compile_entity(entity_json: dict | str | bytes, version: str = "1.0.0") -> str:
     """Compile a JSON entity definition to Python code.
 
     Args:
-        entity_json: JSON dict or JSON string defining the entity
+        entity_json: JSON dict, or JSON str/bytes, defining the entity
         version: Version string for the generated Plugin
 
     Returns:
         Python source code for the Plugin class
+
+    Results are cached per definition and version, so recompiling an
+    unchanged entity is a dictionary lookup.
     """
-    if isinstance(entity_json, str):
-        entity_json = json.loads(entity_json)
+    # repr() keeps key order and value types (list vs tuple, 1 vs 1.0),
+    # both of which change the generated source
+    key = hashlib.blake2b(repr((entity_json, version)).encode(), digest_size=16).hexdigest()
+    if (code := _COMPILE_CACHE.get(key)) is not None:
+        return code
+
+    code = _compile_entity(entity_json, version)
+    if len(_COMPILE_CACHE) >= _COMPILE_CACHE_MAX:
+        # Evict the oldest entry
+        del _COMPILE_CACHE[next(iter(_COMPILE_CACHE))]
+    _COMPILE_CACHE[key] = code
+    return code
 
-    # Extract entity metadata
-    label = entity_json.get("label", "Unnamed Entity")
-    color = entity_json.get("color", "#145070")
-    icon = entity_json.get("icon", "atom-2")
-    description = entity_json.get("description", "")
-    authors = entity_json.get("authors", [])
-    elements = entity_json.get("elements", [])
-    category = entity_json.get("category", "")
-    tags = entity_json.get("tags", [])
-    show_in_ui = entity_json.get("show_in_ui", True)
-    deps = entity_json.get("deps", [])
 
-    # Generate class name from label
-    class_name = to_pascal_case(label)
+def clear_compile_cache() -> None:
+    """Clear the compiled entity cache."""
+    _COMPILE_CACHE.clear()
 
-    # Determine required imports
-    used_classes = set()
-    for element in elements:
-        if isinstance(element, list):
-            for elem in element:
-                elem_type = elem.get("type", "text")
-                used_classes.add(ELEMENT_TYPE_MAP.get(elem_type, "TextInput"))
-        else:
-            elem_type = element.get("type", "text")
-            used_classes.add(ELEMENT_TYPE_MAP.get(elem_type, "TextInput"))
 
-    input_imports = sorted(used_classes & INPUT_CLASSES)
-    display_imports = sorted(used_classes & DISPLAY_CLASSES)
+def compile_entity_to_module(
+    entity_json: dict | str | bytes,
+    module_name: str,
+    version: str = "1.0.0",
+) -> types.ModuleType:
+    """Compile a JSON entity definition straight into an imported module.
 
-    # Build import lines
-    all_element_imports = input_imports + display_imports
-    imports = []
-    if all_element_imports:
-        imports.append(f"from osintbuddy.elements import {', '.join(all_element_imports)}")
-    imports.append("import osintbuddy as ob")
+    Skips writing the generated source to disk and re-importing it, which
+    makes hot reloading an entity a cache lookup plus an exec.
 
-    # Format author as list
-    if isinstance(authors, list):
-        if len(authors) == 0:
-            author_str = '["Unknown"]'
-        else:
-            author_str = format_value(authors)
-    else:
-        author_str = format_value([authors] if authors else ["Unknown"])
+    Args:
+        entity_json: JSON dict, or JSON str/bytes, defining the entity
+        module_name: Name to register the module under in sys.modules
+        version: Version string for the generated Plugin
+
+    Returns:
+        The executed module containing the Plugin class
+    """
+    code = compile_entity(entity_json, version)
+    # Generated code carries no docstrings or asserts, so -OO costs nothing
+    bytecode = compile(code, f"<entity:{module_name}>", "exec", optimize=2)
+    module = types.ModuleType(module_name)
+    sys.modules[module_name] = module
+    try:
+        exec(bytecode, module.__dict__)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def _compile_entity(entity_json: dict | str | bytes, version: str) -> str:
+    """Generate Plugin source for an entity definition (uncached)."""
+    data: dict = _loads(entity_json) if isinstance(entity_json, (str, bytes)) else entity_json
+
+    # Extract entity metadata
+    label = data.get("label", "Unnamed Entity")
+    color = data.get("color", "#145070")
+    icon = data.get("icon", "atom-2")
+    description = data.get("description", "")
+    authors = data.get("authors", [])
+    elements = data.get("elements", [])
+    category = data.get("category", "")
+    tags = data.get("tags", [])
+    show_in_ui = data.get("show_in_ui", True)
+    deps = data.get("deps", [])
 
-    # Generate elements code
-    elements_code = generate_elements_code(elements)
+    # Generate class name from label
+    class_name = to_pascal_case(label)
+
+    # All generated source is appended to one buffer and joined once
+    out: list[str] = []
+
+    # The element import line depends on which classes the elements use,
+    # which is only known once they are emitted; reserve its slot
+    import_slot = len(out)
+    out.append("")
+    out.append("import osintbuddy as ob\n\n\n\n")
 
     # Build the class
-    class_attrs = []
-    class_attrs.append(f'    version = {format_value(version)}')
-    class_attrs.append(f'    label = {format_value(label)}')
-    class_attrs.append(f'    color = {format_value(color)}')
-    class_attrs.append(f'    icon = {format_value(icon)}')
-    class_attrs.append(f'    description = {format_value(description)}')
+    out.append(f"class {class_name}(ob.Plugin):\n")
+    for attr, value in (
+        ("version", version),
+        ("label", label),
+        ("color", color),
+        ("icon", icon),
+        ("description", description),
+    ):
+        out.append(f"    {attr} = ")
+        _emit_value(value, out)
+        out.append("\n")
 
     if category:
-        class_attrs.append(f'    category = {format_value(category)}')
+        out.append("    category = ")
+        _emit_value(category, out)
+        out.append("\n")
 
     if tags:
-        class_attrs.append(f'    tags = {format_value(tags)}')
+        out.append("    tags = ")
+        _emit_value(tags, out)
+        out.append("\n")
 
     if not show_in_ui:
-        class_attrs.append(f'    show_in_ui = False')
+        out.append("    show_in_ui = False\n")
 
     if deps:
-        class_attrs.append(f'    deps = {format_value(deps)}')
-
-    class_attrs.append(f'    elements = {elements_code}')
-    class_attrs.append('')  # Empty line before author
-    class_attrs.append(f'    author = {author_str}')
+        out.append("    deps = ")
+        _emit_value(deps, out)
+        out.append("\n")
 
-    code = f'''{chr(10).join(imports)}
+    out.append("    elements = ")
+    used_classes: set[str] = set()
+    _emit_elements(elements, out, used=used_classes)
+    # Empty line before author
+    out.append("\n\n    author = ")
 
+    # Format author as list
+    if isinstance(authors, list):
+        if len(authors) == 0:
+            out.append('["Unknown"]')
+        else:
+            _emit_value(authors, out)
+    else:
+        _emit_value([authors] if authors else ["Unknown"], out)
+    out.append("\n")
 
+    # Build import lines
+    all_element_imports = [name for name in _IMPORT_ORDER if name in used_classes]
+    if all_element_imports:
+        out[import_slot] = f"from osintbuddy.elements import {', '.join(all_element_imports)}\n"
 
-class {class_name}(ob.Plugin):
-{chr(10).join(class_attrs)}
-'''
-    return code
+    return "".join(out)
 
 
 def compile_file(json_path: str | Path, output_path: str | Path | None = None, version: str = "1.0.0") -> str:
@@ -311,8 +504,8 @@ def compile_file(json_path: str | Path, output_path: str | Path | None = None, v
     """
     json_path = Path(json_path)
 
-    with open(json_path, 'r') as f:
-        entity_json = json.load(f)
+    # Parse the raw bytes directly rather than decoding to str first
+    entity_json = _loads(json_path.read_bytes())
 
     code = compile_entity(entity_json, version=version)
 
@@ -341,16 +534,29 @@ def compile_directory(
 
     Returns:
         Dict mapping input filenames to generated code
+
+    Larger directories are compiled across a process pool; each file is
+    independent, so this scales with the number of cores.
     """
     json_dir = Path(json_dir)
     output_dir = Path(output_dir) if output_dir else json_dir
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    results = {}
-    for json_file in json_dir.glob("*.json"):
-        output_file = output_dir / json_file.with_suffix('.py').name
-        code = compile_file(json_file, output_file, version=version)
-        results[json_file.name] = code
+    jobs = [
+        (json_file, output_dir / json_file.with_suffix('.py').name, version)
+        for json_file in json_dir.glob("*.json")
+    ]
+
+    if len(jobs) < _PARALLEL_COMPILE_MIN:
+        # Not worth the process start-up cost
+        return dict(map(_compile_job, jobs))
+
+    with ProcessPoolExecutor() as executor:
+        return dict(executor.map(_compile_job, jobs))
+
 
-    return results
+def _compile_job(job: tuple[Path, Path, str]) -> tuple[str, str]:
+    """Compile one (json_path, output_path, version) job; module-level so it pickles."""
+    json_file, output_file, version = job
+    return json_file.name, compile_file(json_file, output_file, version=version)
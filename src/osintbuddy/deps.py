@@ -16,14 +16,43 @@ Example usage:
 """
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import re
+import shutil
+import site
 import subprocess
 import sys
+import sysconfig
 import logging
-from functools import lru_cache
+import threading
+import time
+from functools import cache, lru_cache
+from pathlib import Path
 from typing import Sequence
 
 logger = logging.getLogger(__name__)
 
+# Package names already found installed in this process
+_installed: set[str] = set()
+
+# Dependency sets verified by earlier processes: {digest: unix timestamp}
+DEPS_CACHE_PATH = Path.home() / ".osintbuddy" / "cache" / "deps.json"
+DEPS_CACHE_TTL = 24 * 60 * 60
+_verified: dict[str, float] | None = None
+
+# mtimes of the site directories when the in-process caches were filled
+_site_stamp_seen: tuple[int, ...] | None = None
+
+# One installer at a time; transforms may check deps from worker threads
+_install_lock = threading.Lock()
+
+
+_PACKAGE_NAME_RE = re.compile(r'\s*([A-Za-z0-9_.]+(?:-[A-Za-z0-9_.]+)*)')
+
 
 class DependencyError(Exception):
     """Raised when dependency installation fails."""
@@ -39,37 +68,73 @@ def parse_package_name(dep: str) -> str:
     Returns:
         The bare package name for import checking
     """
-    # Remove version specifiers
-    for sep in ('>=', '<=', '==', '!=', '~=', '<', '>'):
-        if sep in dep:
-            dep = dep.split(sep)[0]
-            break
-
-    # Remove extras
-    if '[' in dep:
-        dep = dep.split('[')[0]
-
-    return dep.strip().replace('-', '_')
+    # The leading name, stopping at extras, version specifiers or markers
+    match = _PACKAGE_NAME_RE.match(dep)
+    name = match.group(1) if match else dep.strip()
+    return name.replace('-', '_')
 
 
 def is_package_installed(package_name: str) -> bool:
     """Check if a package is installed and importable.
 
+    Only resolves the module spec; the package's code is not executed.
+
     Args:
         package_name: The package name to check
 
     Returns:
         True if the package can be imported
     """
-    try:
-        __import__(package_name)
+    if package_name in _installed:
         return True
-    except ImportError:
-        return False
+    try:
+        found = importlib.util.find_spec(package_name) is not None
+    except (ImportError, ValueError):
+        found = False
+    if found:
+        _installed.add(package_name)
+    return found
+
+
+@lru_cache(maxsize=1)
+def _installed_dist_names() -> frozenset[str]:
+    """Snapshot the normalized names of every installed distribution.
+
+    Taken once and reused so batch checks cost a set lookup per dep.
+    Cleared by install_packages and clear_deps_cache.
+    """
+    names = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            names.add(name.lower().replace('-', '_').replace('.', '_'))
+    return frozenset(names)
+
+
+def _install_command(packages: Sequence[str], quiet: bool) -> list[str]:
+    """Build the install command, using uv if it is on PATH, otherwise pip."""
+    if uv := shutil.which("uv"):
+        # Target the running interpreter's environment explicitly
+        cmd = [uv, "pip", "install", "--python", sys.executable]
+    else:
+        cmd = [sys.executable, "-m", "pip", "install", "--no-input", "--disable-pip-version-check"]
+    if quiet:
+        cmd.append("--quiet")
+    cmd.extend(packages)
+    return cmd
+
+
+def _install_failed(packages: Sequence[str], returncode: int, stderr: bytes | None) -> DependencyError:
+    """Build the error for a failed install, including the tail of its stderr."""
+    message = f"Failed to install packages {list(packages)} (exit code {returncode})"
+    tail = (stderr or b"").decode(errors="replace").strip().splitlines()[-10:]
+    if tail:
+        message += ":\n" + "\n".join(tail)
+    return DependencyError(message)
 
 
 def install_packages(packages: Sequence[str], quiet: bool = True) -> bool:
-    """Install packages using pip.
+    """Install packages using uv if it is on PATH, otherwise pip.
 
     Args:
         packages: List of package specifications to install
@@ -79,29 +144,109 @@ def install_packages(packages: Sequence[str], quiet: bool = True) -> bool:
         True if installation succeeded
 
     Raises:
-        DependencyError: If installation fails
+        DependencyError: If installation fails (with the installer's stderr
+            tail when quiet)
     """
     if not packages:
         return True
 
-    cmd = [sys.executable, "-m", "pip", "install"]
-    if quiet:
-        cmd.append("--quiet")
-    cmd.extend(packages)
+    with _install_lock:
+        result = subprocess.run(
+            _install_command(packages, quiet),
+            stdout=subprocess.DEVNULL if quiet else None,
+            # Only captured when quiet; otherwise warnings and progress show as usual
+            stderr=subprocess.PIPE if quiet else None,
+        )
+    if result.returncode != 0:
+        raise _install_failed(packages, result.returncode, result.stderr)
+    _installed_dist_names.cache_clear()
+    return True
+
+
+@cache
+def _site_dirs() -> tuple[str, ...]:
+    """Directories packages get installed into for this interpreter."""
+    paths = sysconfig.get_paths()
+    dirs = {paths["purelib"], paths["platlib"]}
+    if site.ENABLE_USER_SITE:
+        dirs.add(site.getusersitepackages())
+    return tuple(sorted(dirs))
 
+
+def _site_stamp() -> tuple[int, ...]:
+    """mtimes of the site directories.
+
+    Installing, upgrading or removing a package adds or removes entries
+    in its site directory, so any change here means earlier checks may
+    no longer hold.
+    """
+    stamp = []
+    for path in _site_dirs():
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+def _deps_key(deps: Sequence[str], stamp: tuple[int, ...]) -> str:
+    """Digest of a dependency set, scoped to the running environment."""
+    payload = json.dumps([sys.prefix, stamp, sorted(deps)])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _load_verified() -> dict[str, float]:
+    """Load the on-disk verified-deps cache once per process."""
+    global _verified
+    if _verified is None:
+        try:
+            with open(DEPS_CACHE_PATH) as f:
+                _verified = json.load(f)
+        except (OSError, ValueError):
+            _verified = {}
+    return _verified
+
+
+def _mark_verified(deps: Sequence[str]) -> None:
+    """Record a dependency set as verified, ignoring filesystem errors."""
+    verified = _load_verified()
+    now = time.time()
+    # Drop stale entries so the file doesn't grow without bound
+    for key in [k for k, ts in verified.items() if now - ts > DEPS_CACHE_TTL]:
+        del verified[key]
+    verified[_deps_key(deps, _site_stamp())] = now
     try:
-        subprocess.check_call(cmd, stdout=subprocess.DEVNULL if quiet else None)
-        return True
-    except subprocess.CalledProcessError as e:
-        raise DependencyError(f"Failed to install packages {packages}: {e}")
+        DEPS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = DEPS_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(verified, f)
+        os.replace(tmp_path, DEPS_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write deps cache: {e}")
+
+
+def _forget_if_site_changed() -> tuple[int, ...]:
+    """Drop in-process results if a package was installed or removed since."""
+    global _site_stamp_seen
+    stamp = _site_stamp()
+    if stamp != _site_stamp_seen:
+        _site_stamp_seen = stamp
+        _ensure_deps.cache_clear()
+        _installed_dist_names.cache_clear()
+        _installed.clear()
+    return stamp
 
 
-@lru_cache(maxsize=256)
 def ensure_deps(deps: tuple[str, ...], auto_install: bool = True) -> bool:
     """Ensure dependencies are installed, optionally installing missing ones.
 
-    This function is cached per unique dependency set, so repeated calls
-    with the same dependencies are fast.
+    Successful checks are cached per unique dependency set, so repeated
+    calls with the same dependencies are fast; failures raise and are
+    retried on the next call. Sets verified within the last
+    DEPS_CACHE_TTL seconds by any process using the same environment are
+    also trusted without re-probing (see DEPS_CACHE_PATH). Both caches
+    are keyed to the mtimes of the site directories, so installing or
+    uninstalling a package, by any means, invalidates them.
 
     Args:
         deps: Tuple of dependency specifications (must be tuple for caching)
@@ -121,6 +266,14 @@ def ensure_deps(deps: tuple[str, ...], auto_install: bool = True) -> bool:
     """
     if not deps:
         return True
+    return _ensure_deps(deps, auto_install, _forget_if_site_changed())
+
+
+@cache
+def _ensure_deps(deps: tuple[str, ...], auto_install: bool, stamp: tuple[int, ...]) -> bool:
+    verified_at = _load_verified().get(_deps_key(deps, stamp))
+    if verified_at is not None and time.time() - verified_at <= DEPS_CACHE_TTL:
+        return True
 
     missing = []
     for dep in deps:
@@ -129,6 +282,7 @@ def ensure_deps(deps: tuple[str, ...], auto_install: bool = True) -> bool:
             missing.append(dep)
 
     if not missing:
+        _mark_verified(deps)
         return True
 
     if not auto_install:
@@ -139,6 +293,8 @@ def ensure_deps(deps: tuple[str, ...], auto_install: bool = True) -> bool:
 
     logger.info(f"Installing missing dependencies: {missing}")
     install_packages(missing)
+    # Make sure the path finders see the freshly installed packages
+    importlib.invalidate_caches()
 
     # Verify installation
     still_missing = []
@@ -150,6 +306,7 @@ def ensure_deps(deps: tuple[str, ...], auto_install: bool = True) -> bool:
     if still_missing:
         raise DependencyError(f"Failed to install: {still_missing}")
 
+    _mark_verified(deps)
     return True
 
 
@@ -171,10 +328,12 @@ def check_deps(deps: Sequence[str]) -> tuple[list[str], list[str]]:
     """
     installed = []
     missing = []
+    dist_names = _installed_dist_names()
 
     for dep in deps:
         pkg_name = parse_package_name(dep)
-        if is_package_installed(pkg_name):
+        # Distribution names first, then import names (e.g. "PIL")
+        if pkg_name.lower().replace('.', '_') in dist_names or is_package_installed(pkg_name):
             installed.append(dep)
         else:
             missing.append(dep)
@@ -186,9 +345,19 @@ def clear_deps_cache() -> None:
     """Clear the dependency check cache.
 
     Call this if you've manually installed packages and want to
-    re-check availability.
+    re-check availability. Also removes the on-disk record of verified
+    dependency sets.
     """
-    ensure_deps.cache_clear()
+    global _verified, _site_stamp_seen
+    _site_stamp_seen = None
+    _ensure_deps.cache_clear()
+    _installed_dist_names.cache_clear()
+    _installed.clear()
+    _verified = {}
+    try:
+        DEPS_CACHE_PATH.unlink(missing_ok=True)
+    except OSError:
+        pass
 
 
 def get_cached_deps() -> dict[tuple[str, ...], bool]:
@@ -197,4 +366,4 @@ def get_cached_deps() -> dict[tuple[str, ...], bool]:
     Returns:
         Cache info from the ensure_deps function
     """
-    return ensure_deps.cache_info()._asdict()
+    return _ensure_deps.cache_info()._asdict()
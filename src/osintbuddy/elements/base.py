@@ -5,11 +5,14 @@ input fields and display components for the UI.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from osintbuddy.types import FieldType
 
+ElementT = TypeVar('ElementT', bound='type[BaseElement]')
+
 
 class BaseElement(object):
     """
@@ -26,27 +29,30 @@ class BaseElement(object):
         field_type: The semantic type of data this element holds (e.g., email, ip_address).
                    Used for type-based transform matching.
     """
+    __slots__ = ('label', 'width', 'field_type')
+
     element_type: str
 
     def __init__(self, **kwargs):
         self.label: str = kwargs.get('label', '')
         self.width: int | None = kwargs.get('width')
-        self.field_type: str | None = None
 
         # Handle field_type - can be string or FieldType enum
-        if ft := kwargs.get('field_type'):
-            if hasattr(ft, 'value'):
-                self.field_type = ft.value
-            else:
-                self.field_type = str(ft)
+        ft = kwargs.get('field_type')
+        if not ft:
+            self.field_type: str | None = None
+        elif ft.__class__ is str:
+            # Plain strings (e.g. compiler output) need no normalization
+            self.field_type = ft
+        elif hasattr(ft, 'value'):
+            self.field_type = ft.value
+        else:
+            self.field_type = str(ft)
 
     def _base_entity_element(self, **kwargs) -> dict:
         """Build base element dictionary for serialization."""
-        base_element = {}
-        if kwargs:
-            base_element = {
-                k: v for k, v in kwargs.items()
-            }
+        # **kwargs is always a fresh dict, so it can be filled in directly
+        base_element = kwargs
         base_element['label'] = self.label
         base_element['type'] = self.element_type
         if self.width is not None:
@@ -63,6 +69,8 @@ class BaseElement(object):
 class BaseInput(BaseElement):
     """Base class for input elements (text fields, dropdowns, etc.)."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -70,5 +78,46 @@ class BaseInput(BaseElement):
 class BaseDisplay(BaseElement):
     """Base class for display elements (titles, images, etc.)."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+
+
+def compile_element(cls: ElementT) -> ElementT:
+    """Class decorator that specializes ``to_dict`` for an element class.
+
+    Whether instances carry an ``element`` dict is known once the class is
+    defined, so the generated ``to_dict`` copies it (or starts empty) and
+    adds the common keys directly, skipping the ``**kwargs`` round trip
+    through ``_base_entity_element``. Key order matches that method.
+
+    The class's ``element_type`` is also interned; identifier-like names
+    already are, but hyphenated ones such as ``copy-text`` are not.
+    """
+    cls.element_type = sys.intern(cls.element_type)
+
+    if hasattr(cls, 'element'):
+        def to_dict(self) -> dict[str, Any]:
+            base_element: dict[str, Any] = self.element.copy()
+            base_element['label'] = self.label
+            base_element['type'] = self.element_type
+            if self.width is not None:
+                base_element['width'] = self.width
+            if self.field_type is not None:
+                base_element['field_type'] = self.field_type
+            return base_element
+    else:
+        def to_dict(self) -> dict[str, Any]:
+            base_element = {'label': self.label, 'type': self.element_type}
+            if self.width is not None:
+                base_element['width'] = self.width
+            if self.field_type is not None:
+                base_element['field_type'] = self.field_type
+            return base_element
+
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = "Convert element to dictionary representation."
+    # Replacing the method per class is the point of this decorator
+    cls.to_dict = to_dict  # type: ignore[method-assign]
+    return cls
@@ -4,16 +4,18 @@ Display elements render read-only content in entity views.
 """
 from __future__ import annotations
 
-from typing import Any
-from osintbuddy.elements.base import BaseDisplay
+from osintbuddy.elements.base import BaseDisplay, compile_element
 
 
+@compile_element
 class Title(BaseDisplay):
     """Title/heading display element.
 
     Example:
         Title(label="Results", value="Search Results")
     """
+    __slots__ = ('element',)
+
     element_type: str = 'title'
 
     def __init__(self, value: str = '', **kwargs):
@@ -22,16 +24,16 @@ class Title(BaseDisplay):
             "value": value,
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class Text(BaseDisplay):
     """Text section display element.
 
     Example:
         Text(label="Description", value="Some text content", icon="info")
     """
+    __slots__ = ('element',)
+
     element_type: str = 'section'
 
     def __init__(self, value: str = '', icon: str = "123", **kwargs):
@@ -41,31 +43,31 @@ class Text(BaseDisplay):
             "icon": icon
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class Empty(BaseDisplay):
     """Empty spacer element.
 
     Example:
         Empty(width=6)  # Half-width spacer
     """
+    __slots__ = ()
+
     element_type: str = 'empty'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
-
 
+@compile_element
 class CopyText(BaseDisplay):
     """Copyable text display element.
 
     Example:
         CopyText(label="API Key", value="abc123...")
     """
+    __slots__ = ('element',)
+
     element_type: str = 'copy-text'
 
     def __init__(self, value: str = '', **kwargs):
@@ -74,16 +76,16 @@ class CopyText(BaseDisplay):
             "value": value
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class CopyCode(BaseDisplay):
     """Copyable code block display element.
 
     Example:
         CopyCode(label="Response", value='{"status": "ok"}')
     """
+    __slots__ = ('element',)
+
     element_type: str = 'copy-code'
 
     def __init__(self, value: str = '', **kwargs):
@@ -92,95 +94,92 @@ class CopyCode(BaseDisplay):
             "value": value
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class Json(BaseDisplay):
     """JSON viewer display element.
 
     Example:
         Json(label="Data")
     """
+    __slots__ = ()
+
     element_type: str = 'json'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
-
 
+@compile_element
 class Image(BaseDisplay):
     """Image display element.
 
     Example:
         Image(label="Screenshot")
     """
+    __slots__ = ()
+
     element_type: str = 'img'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
-
 
+@compile_element
 class Pdf(BaseDisplay):
     """PDF viewer display element.
 
     Example:
         Pdf(label="Document")
     """
+    __slots__ = ()
+
     element_type: str = 'pdf'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
-
 
+@compile_element
 class Video(BaseDisplay):
     """Video player display element.
 
     Example:
         Video(label="Recording")
     """
+    __slots__ = ()
+
     element_type: str = 'video'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
-
 
+@compile_element
 class List(BaseDisplay):
     """List display element.
 
     Example:
         List(label="Items")
     """
+    __slots__ = ()
+
     element_type: str = 'list'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
-
 
+@compile_element
 class Table(BaseDisplay):
     """Table display element.
 
     Example:
         Table(label="Results")
     """
+    __slots__ = ()
+
     element_type: str = 'table'
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element()
@@ -5,9 +5,10 @@ Input elements capture user data in entity forms.
 from __future__ import annotations
 
 from typing import Any
-from osintbuddy.elements.base import BaseInput
+from osintbuddy.elements.base import BaseInput, compile_element
 
 
+@compile_element
 class UploadFileInput(BaseInput):
     """File upload input element.
 
@@ -17,6 +18,8 @@ class UploadFileInput(BaseInput):
     Example:
         UploadFileInput(label="Upload Document", icon="file-upload")
     """
+    __slots__ = ('element',)
+
     element_type: str = "upload"
 
     def __init__(self, value: str = "", icon: str = "IconAlphabetLatin", **kwargs):
@@ -25,10 +28,8 @@ class UploadFileInput(BaseInput):
             "icon": icon
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class TextInput(BaseInput):
     """Single-line text input element.
 
@@ -40,6 +41,8 @@ class TextInput(BaseInput):
     Example:
         TextInput(label="Email", icon="mail", field_type=FieldType.EMAIL)
     """
+    __slots__ = ('element',)
+
     element_type: str = "text"
 
     def __init__(self, value: str = "", icon: str = "IconAlphabetLatin", **kwargs):
@@ -49,10 +52,8 @@ class TextInput(BaseInput):
             "icon": icon
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class TextAreaInput(BaseInput):
     """Multi-line text area input element.
 
@@ -62,6 +63,8 @@ class TextAreaInput(BaseInput):
     Example:
         TextAreaInput(label="Notes", field_type=FieldType.NOTES)
     """
+    __slots__ = ('element',)
+
     element_type: str = "textarea"
 
     def __init__(self, value: str = "", **kwargs):
@@ -70,10 +73,8 @@ class TextAreaInput(BaseInput):
             "value": value,
         }
 
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
-
 
+@compile_element
 class DropdownInput(BaseInput):
     """Dropdown selection input element.
 
@@ -91,6 +92,8 @@ class DropdownInput(BaseInput):
             value={'label': 'Personal'}
         )
     """
+    __slots__ = ('element',)
+
     element_type: str = "dropdown"
 
     def __init__(
@@ -104,6 +107,3 @@ class DropdownInput(BaseInput):
             "options": options or [],
             "value": value or {'label': '', 'tooltip': '', 'value': ''}
         }
-
-    def to_dict(self) -> dict[str, Any]:
-        return self._base_entity_element(**self.element)
@@ -51,31 +51,42 @@ class ErrorCode(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Plain string for each code, so serializing one is a dict lookup; typed by
+# str, since members are str and raw code strings are looked up too
+ERR_STR: dict[str, str] = {c: c.value for c in ErrorCode}
+
+
+def code_str(code: ErrorCode | str | Any) -> str:
+    """Return the wire string for an ErrorCode, a raw code string, or UNKNOWN."""
+    return ERR_STR.get(code, code if isinstance(code, str) else "UNKNOWN")
+
+
 class PluginError(Exception):
     """Base exception for plugin-related errors.
 
     Attributes:
         message: Human-readable error message
-        code: ErrorCode for programmatic handling
+        code: ErrorCode (or its string value) for programmatic handling
         details: Additional error context
     """
 
     def __init__(
         self,
         message: str,
-        code: ErrorCode = ErrorCode.UNKNOWN,
+        code: ErrorCode | str = ErrorCode.UNKNOWN,
         details: dict[str, Any] | None = None
     ):
         super().__init__(message)
         self.message = message
-        self.code = code if isinstance(code, ErrorCode) else ErrorCode.UNKNOWN
+        # Either an ErrorCode or its string value; to_dict normalizes both
+        self.code = code
         self.details = details or {}
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "error": self.message,
-            "code": self.code.value if isinstance(self.code, ErrorCode) else str(self.code),
+            "code": code_str(self.code),
             "details": self.details,
         }
 
@@ -2,6 +2,11 @@
 
 Provides a cross-platform IPC channel over an extra stdio pipe (fd 3).
 Stdout/stderr remain free for plugin developer logs.
+
+Frame bodies are JSON by default. A peer may send a ``hello`` message
+listing the codecs it understands; if ``msgpack`` is among them and
+ormsgpack is installed, the worker answers in JSON and switches both
+directions to MessagePack for every following frame.
 """
 from __future__ import annotations
 
@@ -11,16 +16,118 @@ import inspect
 import json
 import os
 import struct
-import sys
-from datetime import datetime
-from typing import Any, AsyncIterator, Iterator
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterator
 
 from osintbuddy import Registry, load_plugins_fs
-from osintbuddy.plugins import TransformPayload
+from osintbuddy._introspect import (
+    clear_plugin_infos,
+    iso8601,
+    last_edit,
+    module_stats,
+    plugin_info,
+    plugin_instance,
+    read_source,
+    transform_brief,
+    transform_info,
+)
+from osintbuddy.plugins import Plugin, TransformPayload, transform_meta
 from osintbuddy.results import normalize_result
-from osintbuddy.output import ProgressEvent, set_progress_callback
+from osintbuddy.output import ProgressEvent, decoded_default, json_default, set_progress_callback
 from osintbuddy.utils import to_snake_case
-from osintbuddy.errors import PluginError, ErrorCode
+from osintbuddy.errors import PluginError, ErrorCode, code_str
+
+try:
+    import orjson
+
+    def _dumps(message: Any) -> bytes:
+        return orjson.dumps(message, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message, default=json_default).encode("utf-8")
+
+    def _loads(data: bytes | bytearray | memoryview | str, /) -> Any:
+        # json.loads takes bytes but not a memoryview
+        return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional speedup
+    ormsgpack = None  # type: ignore[assignment]
+
+
+def _msgpack_dumps(message: Any) -> bytes:
+    return ormsgpack.packb(message, default=decoded_default, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return ormsgpack.unpackb(data, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+# Frame body codecs: name -> (encode, decode); every frame body is a dict
+_CODECS: dict[str, tuple[Callable[[Any], bytes], Callable[[Any], dict[str, Any]]]] = {
+    "json": (_dumps, _loads),
+}
+if ormsgpack is not None:
+    _CODECS["msgpack"] = (_msgpack_dumps, _msgpack_loads)
+
+
+def _decode_payload(data: str | bytes) -> Any:
+    """Decode a JSON str/bytes payload, or MessagePack bytes."""
+    if ormsgpack is None or isinstance(data, str) or data.lstrip()[:1] in (b"{", b"["):
+        return _loads(data)
+    return _msgpack_loads(data)
+
+
+# Error code strings used on the wire
+_CODE_INVALID_INPUT = ErrorCode.INVALID_INPUT.value
+_CODE_PLUGIN_NOT_FOUND = ErrorCode.PLUGIN_NOT_FOUND.value
+_CODE_PLUGIN_LOAD_ERROR = ErrorCode.PLUGIN_LOAD_ERROR.value
+_CODE_TRANSFORM_NOT_FOUND = ErrorCode.TRANSFORM_NOT_FOUND.value
+_CODE_UNKNOWN = ErrorCode.UNKNOWN.value
+
+# Big-endian u32 length prefix of every frame
+_HDR = struct.Struct(">I")
+
+# Most platforms cap a single writev() at 1024 buffers
+_IOV_MAX = 1024
+
+# IPC outbox limits: frames queue up to this many buffers (two per frame)
+# or bytes before being flushed without waiting for the loop to go idle
+_OUTBOX_MAX_BUFFERS = 128
+_OUTBOX_MAX_BYTES = 64 * 1024
+
+# Events flushed immediately: progress, so the peer sees it while a
+# transform is still working, and the events that end a request
+_FLUSH_EVENTS = frozenset({"progress", "done", "error"})
+
+# Progress messages from one list chunk are flushed in batches of this size
+_SEND_WINDOW = 256
+
+# Returned by next() once a sync generator transform is done
+_EXHAUSTED = object()
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+@lru_cache(maxsize=1024)
+def _kind(fn: Any) -> str:
+    """One of "asyncgen", "gen", "coro" or "sync"."""
+    if inspect.isasyncgenfunction(fn):
+        return "asyncgen"
+    if inspect.isgeneratorfunction(fn):
+        return "gen"
+    if inspect.iscoroutinefunction(fn):
+        return "coro"
+    return "sync"
 
 
 def _default_plugins_path() -> str:
@@ -28,69 +135,161 @@ def _default_plugins_path() -> str:
 
 
 class IpcChannel:
-    """Length-prefixed JSON messages over a binary stream."""
+    """Length-prefixed JSON (or negotiated MessagePack) messages over a binary stream."""
 
     def __init__(self, read_fd: int = 0, write_fd: int = 3) -> None:
         self._reader = os.fdopen(read_fd, "rb", buffering=0)
-        self._writer = os.fdopen(write_fd, "wb", buffering=0)
+        self._write_fd = write_fd
+        self._hdr_buf = bytearray(_HDR.size)
+        self._body_buf = bytearray(65536)
+        self.codec = "json"
+        self._encode, self._decode = _CODECS["json"]
+
+    def use_codec(self, codec: str) -> None:
+        """Switch the body codec for all subsequent frames."""
+        self.codec = codec
+        self._encode, self._decode = _CODECS[codec]
 
     def send(self, message: dict[str, Any]) -> None:
-        payload = json.dumps(message).encode("utf-8")
-        header = struct.pack(">I", len(payload))
-        self._writer.write(header + payload)
-        self._writer.flush()
+        payload = self._encode(message)
+        self._write([_HDR.pack(len(payload)), payload])
+
+    def send_many(self, messages: list[dict[str, Any]]) -> None:
+        """Send several messages with as few write syscalls as possible."""
+        buffers: list[bytes] = []
+        encode = self._encode
+        for message in messages:
+            payload = encode(message)
+            buffers.append(_HDR.pack(len(payload)))
+            buffers.append(payload)
+        if buffers:
+            self._write(buffers)
+
+    def _write(self, buffers: list[bytes]) -> None:
+        fd = self._write_fd
+        if not hasattr(os, "writev"):
+            # Windows has no writev; a single joined write is the next best
+            _write_all(fd, b"".join(buffers))
+            return
+        for start in range(0, len(buffers), _IOV_MAX):
+            batch = buffers[start:start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                # Short write: finish the rest of this batch by hand
+                _write_all(fd, memoryview(b"".join(batch))[written:])
+
+    def _read_exact(self, view: memoryview) -> bool:
+        """Fill view from the reader; False if the stream ends first."""
+        while view:
+            n = self._reader.readinto(view)
+            if not n:
+                return False
+            view = view[n:]
+        return True
 
     def recv(self) -> dict[str, Any] | None:
-        header = self._reader.read(4)
-        if not header:
+        # Frames are read into reused buffers and decoded straight from a
+        # memoryview, so small control messages allocate nothing but the result
+        if not self._read_exact(memoryview(self._hdr_buf)):
             return None
-        (size,) = struct.unpack(">I", header)
+        (size,) = _HDR.unpack_from(self._hdr_buf)
         if size <= 0:
             return None
-        body = self._reader.read(size)
-        if not body:
+        if size > len(self._body_buf):
+            self._body_buf = bytearray(size)
+        body = memoryview(self._body_buf)[:size]
+        if not self._read_exact(body):
             return None
-        return json.loads(body.decode("utf-8"))
+        return self._decode(body)
 
 
 class ObWorker:
     def __init__(self) -> None:
         self.plugins_path: str | None = None
+        # (plugins path, include_source) -> (module file mtimes, cached response)
+        self._list_entities_cache: dict[tuple[str, bool], tuple[tuple, list[dict[str, Any]]]] = {}
+        self._entities_json_cache: dict[tuple[str, bool], tuple[tuple, list[tuple[type[Plugin], dict[str, Any]]]]] = {}
+        self._plugin_instances: dict[type, Any] = {}
+        # Transforms running against the loaded plugins; see using_plugins
+        self._active_transforms = 0
 
     def _reset_registry(self) -> None:
+        self._plugin_instances.clear()
+        clear_plugin_infos()
         Registry.labels.clear()
         Registry.plugins.clear()
         Registry.ui_labels.clear()
         if hasattr(Registry, "transforms_map"):
             Registry.transforms_map.clear()
 
-    def ensure_plugins(self, plugins_path: str | None = None) -> None:
+    def ensure_plugins(self, plugins_path: str | None = None) -> str:
+        """Load the plugins directory unless it is already loaded; returns its path."""
         path = plugins_path or _default_plugins_path()
         if self.plugins_path == path:
-            return
+            return path
+        if self._active_transforms:
+            # Resetting the Registry would pull the plugins out from under them
+            raise PluginError(
+                f"Cannot load plugins from {path} while {self._active_transforms} "
+                f"transform(s) from {self.plugins_path} are running",
+                _CODE_PLUGIN_LOAD_ERROR,
+            )
         self._reset_registry()
         load_plugins_fs(path)
+        for plugin_cls in Registry.plugins.values():
+            plugin_info(plugin_cls)
         self.plugins_path = path
+        return path
 
-    def list_entities(self, plugins_path: str | None = None) -> list[dict[str, Any]]:
+    @contextmanager
+    def using_plugins(self, plugins_path: str | None = None) -> Iterator[None]:
+        """Load a plugins directory and keep it loaded until the block exits.
+
+        Requests for another directory fail with a PluginError meanwhile,
+        instead of resetting the Registry under a running transform.
+        """
         self.ensure_plugins(plugins_path)
+        self._active_transforms += 1
+        try:
+            yield
+        finally:
+            self._active_transforms -= 1
+
+    def _module_stats(self) -> dict[str, os.stat_result | None]:
+        """Stat every loaded plugin module file once, in registry order."""
+        return module_stats([plugin_info(plugin).module_file for plugin in Registry.plugins.values()])
+
+    @staticmethod
+    def _stats_signature(stats: dict[str, os.stat_result | None]) -> tuple:
+        return tuple((path, st and st.st_mtime_ns) for path, st in stats.items())
+
+    def list_entities(
+        self, plugins_path: str | None = None, include_source: bool = True
+    ) -> list[dict[str, Any]]:
+        cache_key = (self.ensure_plugins(plugins_path), include_source)
+        stats = self._module_stats()
+        signature = self._stats_signature(stats)
+        cached = self._list_entities_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         results: list[dict[str, Any]] = []
         for plugin in Registry.plugins.values():
-            path = f"{sys.modules[plugin.__module__].__file__}"
-            with open(path, "r") as fh:
-                source = fh.read()
-            last_file_edit = datetime.utcfromtimestamp(
-                os.path.getmtime(path)
-            ).strftime("%Y-%m-%d %H:%M:%S")
+            info = plugin_info(plugin)
+            path = info.module_file
+            stat = stats[path] or os.stat(path)
+            source = read_source(path, stat.st_mtime_ns) if include_source else None
+            last_file_edit = last_edit(stat.st_mtime)
             results.append(
                 dict(
-                    label=getattr(plugin, "label", "unknown"),
-                    author=getattr(plugin, "author", "Unknown author"),
-                    description=getattr(plugin, "description", "No description found..."),
+                    label=info.label,
+                    author=info.author,
+                    description=info.description,
                     source=source,
                     last_edit=last_file_edit,
                 )
             )
+        self._list_entities_cache[cache_key] = (signature, results)
         return results
 
     async def list_transforms(
@@ -103,31 +302,11 @@ class ObWorker:
         plugin_cls = await Registry.get_entity(snake_label)
         if plugin_cls is None:
             return []
-        entity_id = getattr(plugin_cls, "entity_id", None) or to_snake_case(plugin_cls.label)
-        entity_version = getattr(plugin_cls, "version", "0")
-        mapping = Registry.find_transforms(entity_id, entity_version)
+        info = plugin_info(plugin_cls)
+        mapping = Registry.find_transforms(info.entity_id, info.version)
         if not mapping:
             return []
-        transforms = []
-        for fn in mapping.values():
-            transform_info = {
-                "label": getattr(fn, "label", "unknown"),
-                "icon": getattr(fn, "icon", "list"),
-                "edge_label": getattr(fn, "edge_label", getattr(fn, "label", "unknown")),
-            }
-            if deps := getattr(fn, "deps", None):
-                transform_info["deps"] = deps
-            if accepts := getattr(fn, "accepts", None):
-                transform_info["accepts"] = accepts
-            if produces := getattr(fn, "produces", None):
-                transform_info["produces"] = produces
-            if settings := getattr(fn, "settings", None):
-                transform_info["settings"] = [
-                    {"name": s.name, "display_name": s.display_name, "required": s.required}
-                    for s in settings
-                ]
-            transforms.append(transform_info)
-        return transforms
+        return [transform_info(fn) for fn in mapping.values()]
 
     async def get_blueprints(
         self,
@@ -137,87 +316,86 @@ class ObWorker:
         self.ensure_plugins(plugins_path)
         blueprints: dict[str, Any] = {}
         if label is None:
-            plugins = [
-                await Registry.get_entity(to_snake_case(lbl))
-                for lbl in Registry.labels
-            ]
-            for entity in plugins:
+            # Registry.plugins already maps every label to its class
+            for entity in Registry.plugins.values():
                 blueprint = entity.blueprint()
                 blueprints[blueprint.get("label")] = blueprint
             return blueprints
         plugin = await Registry.get_entity(label)
         return plugin.blueprint() if plugin else {}
 
-    async def entities_json(self, plugins_path: str | None = None) -> dict[str, Any]:
-        from datetime import datetime, timezone
-
-        def iso8601(ts: float) -> str:
-            return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        self.ensure_plugins(plugins_path)
+    async def entities_json(
+        self, plugins_path: str | None = None, include_source: bool = True
+    ) -> dict[str, Any]:
+        cache_key = (self.ensure_plugins(plugins_path), include_source)
+        stats = self._module_stats()
+        signature = self._stats_signature(stats)
+        cached = self._entities_json_cache.get(cache_key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, self._entity_rows(stats, include_source))
+            self._entities_json_cache[cache_key] = cached
+
+        # Cached rows leave "blueprint" empty so every response gets fresh ids
         results = []
-        for plugin_cls in Registry.plugins.values():
-            module_file = f"{sys.modules[plugin_cls.__module__].__file__}"
+        for plugin_cls, row in cached[1]:
             try:
-                with open(module_file, "r") as fh:
-                    source = fh.read()
+                blueprint = plugin_cls.blueprint()
             except Exception:
-                source = None
-            try:
-                stat = os.stat(module_file)
+                blueprint = None
+            results.append({**row, "blueprint": blueprint})
+        return {"entities": results, "favorites": []}
+
+    def _entity_rows(
+        self, stats: dict[str, os.stat_result | None], include_source: bool
+    ) -> list[tuple[type[Plugin], dict[str, Any]]]:
+        """entities_json rows per plugin class, minus the blueprint."""
+        rows = []
+        for plugin_cls in Registry.plugins.values():
+            info = plugin_info(plugin_cls)
+            module_file = info.module_file
+            stat = stats[module_file]
+            source = None
+            if include_source:
+                try:
+                    source = read_source(module_file, stat and stat.st_mtime_ns)
+                except Exception:
+                    pass
+            if stat is not None:
                 ctime = iso8601(stat.st_ctime)
                 mtime = iso8601(stat.st_mtime)
-            except Exception:
+            else:
                 ctime = None
                 mtime = None
-            label = getattr(plugin_cls, "label", "unknown")
-            entity_id = getattr(plugin_cls, "entity_id", None) or to_snake_case(label)
-            version = getattr(plugin_cls, "version", "0")
-            author = getattr(plugin_cls, "author", "Unknown author")
-            description = getattr(plugin_cls, "description", "No description found...")
-            category = getattr(plugin_cls, "category", "")
-            tags = getattr(plugin_cls, "tags", [])
-            try:
-                blueprint = plugin_cls.blueprint()
-            except Exception:
-                blueprint = None
-            mapping = Registry.find_transforms(entity_id, version) or {}
-            transforms = []
-            for fn in mapping.values():
-                transforms.append(
-                    {
-                        "label": getattr(fn, "label", "unknown"),
-                        "icon": getattr(fn, "icon", "list"),
-                        "edge_label": getattr(fn, "edge_label", getattr(fn, "label", "unknown")),
-                    }
-                )
-            results.append(
+            mapping = Registry.find_transforms(info.entity_id, info.version) or {}
+            transforms = [transform_brief(fn) for fn in mapping.values()]
+            rows.append((
+                plugin_cls,
                 {
-                    "id": entity_id,
-                    "label": label,
-                    "description": description,
-                    "author": author,
-                    "category": category,
-                    "tags": tags,
+                    "id": info.entity_id,
+                    "label": info.label,
+                    "description": info.description,
+                    "author": info.author,
+                    "category": info.category,
+                    "tags": info.tags,
                     "source": source,
                     "source_path": module_file,
                     "ctime": ctime,
                     "mtime": mtime,
-                    "blueprint": blueprint,
+                    "blueprint": None,
                     "transforms": transforms,
-                }
-            )
-        return {"entities": results, "favorites": []}
+                },
+            ))
+        return rows
 
     async def run_transform(
         self,
-        source: str | dict[str, Any],
+        source: str | bytes | dict[str, Any],
         plugins_path: str | None = None,
-        cfg: str | dict[str, Any] | None = None,
+        cfg: str | bytes | dict[str, Any] | None = None,
     ) -> tuple[str, Any]:
         self.ensure_plugins(plugins_path)
-        if isinstance(source, str):
-            src = json.loads(source)
+        if isinstance(source, (str, bytes)):
+            src = _decode_payload(source)
         else:
             src = source
 
@@ -232,67 +410,154 @@ class ObWorker:
             entity_payload = {"data": {"label": source_entity_label, **src.get("data", {})}}
 
         if not transform_label:
-            raise PluginError("Missing transform in payload", ErrorCode.INVALID_INPUT.value)
+            raise PluginError("Missing transform in payload", _CODE_INVALID_INPUT)
         if not source_entity_label:
-            raise PluginError("Missing entity label in payload", ErrorCode.INVALID_INPUT.value)
+            raise PluginError("Missing entity label in payload", _CODE_INVALID_INPUT)
 
         snake_label = to_snake_case(source_entity_label)
         plugin_cls = await Registry.get_entity(snake_label)
         if plugin_cls is None:
-            raise PluginError(f"Plugin not found: {snake_label}", ErrorCode.PLUGIN_NOT_FOUND.value)
+            raise PluginError(f"Plugin not found: {snake_label}", _CODE_PLUGIN_NOT_FOUND)
 
-        entity_id = getattr(plugin_cls, "entity_id", None) or to_snake_case(plugin_cls.label)
-        entity_version = getattr(plugin_cls, "version", "0")
-        mapping = Registry.find_transforms(entity_id, entity_version)
+        info = plugin_info(plugin_cls)
+        mapping = Registry.find_transforms(info.entity_id, info.version)
 
         tkey = to_snake_case(transform_label)
         transform_fn = mapping.get(tkey)
         if transform_fn is None:
-            raise PluginError(f"Transform not found: {transform_label}", ErrorCode.TRANSFORM_NOT_FOUND.value)
+            raise PluginError(f"Transform not found: {transform_label}", _CODE_TRANSFORM_NOT_FOUND)
 
         entity_dict = entity_payload
         entity_data = entity_dict.get("data", {})
-        entity_arg = TransformPayload(
-            **{
-                **{to_snake_case(k): v for k, v in entity_data.items()},
-                "id": entity_dict.get("id"),
-                "label": entity_data.get("label"),
-            }
-        )
+        fields = {to_snake_case(k): v for k, v in entity_data.items()}
+        fields["id"] = entity_dict.get("id")
+        fields["label"] = entity_data.get("label")
+        entity_arg = TransformPayload.model_validate(fields)
 
         cfg_obj = None
         if cfg:
             try:
-                cfg_obj = json.loads(cfg) if isinstance(cfg, str) else cfg
-            except json.JSONDecodeError:
+                cfg_obj = _decode_payload(cfg) if isinstance(cfg, (str, bytes)) else cfg
+            except ValueError:
                 cfg_obj = cfg
 
         deps = getattr(transform_fn, "deps", None)
         if deps:
             from osintbuddy.deps import ensure_deps
-            ensure_deps(tuple(deps))
+            # May probe the filesystem or run an installer: keep it off the loop
+            await asyncio.to_thread(ensure_deps, tuple(deps))
 
-        plugin_instance = plugin_cls()
-        sig = inspect.signature(transform_fn)
-        kwargs = {}
-        if "cfg" in sig.parameters:
+        kwargs: dict[str, Any] = {"entity": entity_arg}
+        meta = transform_meta(transform_fn)
+        if meta["takes_cfg"]:
             kwargs["cfg"] = cfg_obj
-
-        if inspect.isasyncgenfunction(transform_fn) or inspect.isgeneratorfunction(transform_fn):
-            try:
-                result = transform_fn(self=plugin_instance, entity=entity_arg, **kwargs)
-            except TypeError:
-                result = transform_fn(entity=entity_arg, **kwargs)
+        if meta["needs_self"]:
+            kwargs["self"] = plugin_instance(self._plugin_instances, plugin_cls)
+
+        kind = _kind(transform_fn)
+        if kind == "sync":
+            # A plain function blocks; to_thread copies the context, so its
+            # progress still reaches this request
+            result = await asyncio.to_thread(transform_fn, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
         else:
-            try:
-                result = await transform_fn(self=plugin_instance, entity=entity_arg, **kwargs)
-            except TypeError:
-                result = await transform_fn(entity=entity_arg, **kwargs)
+            result = transform_fn(**kwargs)
+            if kind == "coro":
+                result = await result
 
         edge_label = getattr(transform_fn, "edge_label", tkey)
         return edge_label, result
 
 
+class AsyncIpcChannel(IpcChannel):
+    """IpcChannel whose recv runs on the event loop, so requests can overlap.
+
+    Outgoing frames are queued whole and flushed with one writev once the
+    current event-loop turn ends, when the queue passes _OUTBOX_MAX_BUFFERS
+    or _OUTBOX_MAX_BYTES, or right away for _FLUSH_EVENTS. Frames sent
+    from other threads (e.g. progress from a sync transform) are written
+    at once, after whatever is queued. Frames from concurrent handlers
+    never interleave.
+    """
+
+    def __init__(self, read_fd: int = 0, write_fd: int = 3) -> None:
+        super().__init__(read_fd, write_fd)
+        self._stream: asyncio.StreamReader | None = None
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._flush_scheduled = False
+        # Guards the outbox and the fd against writers on other threads
+        self._lock = threading.Lock()
+
+    def send(self, message: dict[str, Any]) -> None:
+        super().send(message)
+        if message.get("event") in _FLUSH_EVENTS:
+            self.flush()
+
+    def send_many(self, messages: list[dict[str, Any]]) -> None:
+        super().send_many(messages)
+        if any(message.get("event") in _FLUSH_EVENTS for message in messages):
+            self.flush()
+
+    def _write(self, buffers: list[bytes]) -> None:
+        with self._lock:
+            self._pending.extend(buffers)
+            self._pending_bytes += sum(map(len, buffers))
+            if len(self._pending) >= _OUTBOX_MAX_BUFFERS or self._pending_bytes >= _OUTBOX_MAX_BYTES:
+                self._flush_locked()
+                return
+            if self._flush_scheduled:
+                return
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Called from outside the loop (e.g. a transform's thread)
+                self._flush_locked()
+                return
+            self._flush_scheduled = True
+        loop.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Write out every queued frame."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._flush_scheduled = False
+        if self._pending:
+            buffers, self._pending = self._pending, []
+            self._pending_bytes = 0
+            super()._write(buffers)
+
+    async def connect(self) -> None:
+        """Attach the read end to the running loop, if the platform allows it."""
+        loop = asyncio.get_running_loop()
+        stream = asyncio.StreamReader()
+        try:
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(stream), self._reader
+            )
+        except (NotImplementedError, ValueError, OSError):
+            # Not a pipe (e.g. a regular file), or no pipe support in this
+            # loop: recv falls back to blocking reads in a thread
+            return
+        self._stream = stream
+
+    async def recv(self) -> dict[str, Any] | None:  # type: ignore[override]
+        if self._stream is None:
+            return await asyncio.to_thread(super().recv)
+        try:
+            header = await self._stream.readexactly(_HDR.size)
+            (size,) = _HDR.unpack_from(header)
+            if size <= 0:
+                return None
+            body = await self._stream.readexactly(size)
+        except asyncio.IncompleteReadError:
+            return None
+        return self._decode(body)
+
+
 def _iter_results(value: Any) -> Iterator[Any] | AsyncIterator[Any] | None:
     if inspect.isasyncgen(value):
         return value
@@ -307,22 +572,23 @@ async def _send_transform_events(
     channel: IpcChannel,
     req_id: str,
     worker: ObWorker,
-    source: str | dict[str, Any],
+    source: str | bytes | dict[str, Any],
     plugins_path: str | None,
-    cfg: str | dict[str, Any] | None,
+    cfg: str | bytes | dict[str, Any] | None,
 ) -> None:
     count = 0
 
+    def message(event: str, payload: Any, ok: bool = True) -> dict[str, Any]:
+        return {
+            "id": req_id,
+            "type": "transform",
+            "event": event,
+            "ok": ok,
+            "payload": payload,
+        }
+
     def emit(event: str, payload: Any, ok: bool = True) -> None:
-        channel.send(
-            {
-                "id": req_id,
-                "type": "transform",
-                "event": event,
-                "ok": ok,
-                "payload": payload,
-            }
-        )
+        channel.send(message(event, payload, ok))
 
     def _extract_progress(value: Any) -> dict[str, Any] | None:
         if isinstance(value, ProgressEvent):
@@ -334,20 +600,24 @@ async def _send_transform_events(
     def _emit_result_chunk(chunk: Any, edge_label: str) -> None:
         nonlocal count
         if isinstance(chunk, (list, tuple)):
-            progress_payloads: list[dict[str, Any]] = []
+            # One pass: progress is queued as it is found and flushed in
+            # windows, so the peer sees it before a long chunk is done
+            messages: list[dict[str, Any]] = []
             results: list[Any] = []
             for item in chunk:
                 progress = _extract_progress(item)
-                if progress is not None:
-                    progress_payloads.append(progress)
-                else:
+                if progress is None:
                     results.append(item)
-            for payload in progress_payloads:
-                emit("progress", payload)
+                    continue
+                messages.append(message("progress", progress))
+                if len(messages) >= _SEND_WINDOW:
+                    channel.send_many(messages)
+                    messages = []
             if results:
                 normalized = normalize_result(results, default_edge_label=edge_label)
                 count += len(normalized)
-                emit("result", normalized)
+                messages.append(message("result", normalized))
+            channel.send_many(messages)
             return
 
         progress = _extract_progress(chunk)
@@ -365,24 +635,30 @@ async def _send_transform_events(
     set_progress_callback(on_progress)
     try:
         emit("progress", {"message": "Starting transform", "percent": 0})
-        edge_label, result = await worker.run_transform(
-            source=source,
-            plugins_path=plugins_path,
-            cfg=cfg,
-        )
+        with worker.using_plugins(plugins_path):
+            edge_label, result = await worker.run_transform(
+                source=source,
+                plugins_path=plugins_path,
+                cfg=cfg,
+            )
 
-        stream = _iter_results(result)
-        if stream is not None:
-            if inspect.isasyncgen(stream) or hasattr(stream, "__aiter__"):
-                async for chunk in stream:  # type: ignore[misc]
-                    _emit_result_chunk(chunk, edge_label)
+            stream = _iter_results(result)
+            if stream is not None:
+                if inspect.isasyncgen(stream) or hasattr(stream, "__aiter__"):
+                    async for chunk in stream:  # type: ignore[misc]
+                        _emit_result_chunk(chunk, edge_label)
+                else:
+                    # Each step of a sync generator may block, so it runs in
+                    # a thread while other requests keep the loop
+                    while True:
+                        chunk = await asyncio.to_thread(next, stream, _EXHAUSTED)
+                        if chunk is _EXHAUSTED:
+                            break
+                        _emit_result_chunk(chunk, edge_label)
             else:
-                for chunk in stream:  # type: ignore[assignment]
-                    _emit_result_chunk(chunk, edge_label)
-        else:
-            _emit_result_chunk(result, edge_label)
+                _emit_result_chunk(result, edge_label)
 
-        emit("done", {"count": count})
+            emit("done", {"count": count})
     finally:
         set_progress_callback(None)
 
@@ -404,8 +680,16 @@ async def _handle_message(channel: IpcChannel, worker: ObWorker, message: dict[s
         )
 
     try:
-        if msg_type == "entities":
-            data = worker.list_entities(payload.get("pluginsPath"))
+        if msg_type == "hello":
+            requested = payload.get("codecs") or []
+            codec = next((c for c in requested if c in _CODECS), "json")
+            # Answer in the current codec, then switch
+            respond("response", {"codec": codec, "codecs": list(_CODECS)})
+            channel.use_codec(codec)
+        elif msg_type == "entities":
+            data = worker.list_entities(
+                payload.get("pluginsPath"), payload.get("include_source", True)
+            )
             respond("response", data)
         elif msg_type == "transforms":
             label = payload.get("label") or ""
@@ -415,7 +699,9 @@ async def _handle_message(channel: IpcChannel, worker: ObWorker, message: dict[s
             data = await worker.get_blueprints(payload.get("label"), payload.get("pluginsPath"))
             respond("response", data)
         elif msg_type == "entities_json":
-            data = await worker.entities_json(payload.get("pluginsPath"))
+            data = await worker.entities_json(
+                payload.get("pluginsPath"), payload.get("include_source", True)
+            )
             respond("response", data)
         elif msg_type == "transform":
             await _send_transform_events(
@@ -431,11 +717,28 @@ async def _handle_message(channel: IpcChannel, worker: ObWorker, message: dict[s
     except PluginError as e:
         respond(
             "error",
-            {"message": str(e), "code": getattr(e.code, "value", str(e.code))},
+            {"message": str(e), "code": code_str(e.code)},
             ok=False,
         )
     except Exception as e:
-        respond("error", {"message": str(e), "code": ErrorCode.UNKNOWN.value}, ok=False)
+        respond("error", {"message": str(e), "code": _CODE_UNKNOWN}, ok=False)
+
+
+async def _serve(channel: AsyncIpcChannel, worker: ObWorker) -> None:
+    """Handle each incoming message as its own task until the peer hangs up."""
+    await channel.connect()
+    tasks: set[asyncio.Task[None]] = set()
+    while True:
+        msg = await channel.recv()
+        if msg is None:
+            break
+        task = asyncio.create_task(_handle_message(channel, worker, msg))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    # Let in-flight requests finish streaming before exiting
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    channel.flush()
 
 
 def main() -> None:
@@ -447,13 +750,18 @@ def main() -> None:
     if args.plugins:
         worker.ensure_plugins(args.plugins)
 
-    channel = IpcChannel()
+    channel = AsyncIpcChannel()
 
-    while True:
-        msg = channel.recv()
-        if msg is None:
-            break
-        asyncio.run(_handle_message(channel, worker, msg))
+    # One loop for the worker's lifetime, so async resources created by
+    # transforms (sessions, pools) survive between requests
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(_serve(channel, worker))
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        asyncio.set_event_loop(None)
+        loop.close()
 
 
 if __name__ == "__main__":
@@ -35,7 +35,7 @@ class MessageType(str, Enum):
     SUCCESS = "success"
 
 
-@dataclass
+@dataclass(slots=True)
 class UIMessage:
     """A message to display in the UI.
 
@@ -63,7 +63,7 @@ class UIMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformResponse:
     """Complete response from a transform including entities and messages.
 
@@ -91,7 +91,16 @@ class TransformResponse:
         """Convert to dictionary for serialization."""
         return {
             "entities": self.entities,  # Will be normalized by normalize_result
-            "messages": [m.to_dict() for m in self.messages],
+            "messages": [
+                {
+                    "message": m.message,
+                    "type": m.type.value,
+                    "title": m.title,
+                    "details": m.details,
+                    "duration": m.duration,
+                }
+                for m in self.messages
+            ],
             "metadata": self.metadata,
         }
 
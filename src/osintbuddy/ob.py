@@ -18,51 +18,104 @@ Commands:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
 import json
+import logging
 import os
 import sys
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
-from datetime import datetime, timezone
+from collections.abc import Mapping
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, NoReturn
+from uuid import uuid4
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.traceback import install as install_traceback
-
-from osintbuddy import Registry, __version__, load_plugins_fs
-from osintbuddy.plugins import TransformPayload
-from osintbuddy.utils import to_snake_case
-from osintbuddy.results import normalize_result
-from osintbuddy.output import emit_result, emit_error, emit_progress, emit_json
-from osintbuddy.errors import PluginError, ErrorCode
-from osintbuddy.cli.console import console, err_console, OSIB_THEME
-from osintbuddy.cli.display import (
-    print_banner,
-    print_error,
-    print_success,
-    print_warning,
-    print_info,
-    print_entities_table,
-    print_transforms_table,
+if TYPE_CHECKING:
+    import httpx
+
+# The plugin framework (Registry, pydantic models, utils) is imported by the
+# commands that load plugins, so cached listings never pay for it. Rich and
+# the display helpers are likewise imported where output is for a person,
+# so scripted calls (--no-interactive, --structured) start faster.
+from osintbuddy import __version__
+from osintbuddy._introspect import (
+    clear_plugin_infos,
+    iso8601,
+    last_edit,
+    module_stats,
+    plugin_info,
+    plugin_instance,
+    read_source,
+    transform_info,
 )
-from osintbuddy.cli.progress import (
-    Step,
-    StepRunner,
-    TransformProgress,
-    PluginLoadProgress,
+from osintbuddy.output import (
+    ProgressEvent,
+    decoded_default,
+    emit_error,
+    emit_json,
+    emit_progress,
+    emit_result,
+    emit_result_astream,
+    flush_progress,
+    json_default,
 )
-from osintbuddy.cli.logging import setup_logging, get_logger
 
-# Install rich traceback handler for beautiful error display
-install_traceback(show_locals=True, console=err_console)
+try:
+    import orjson
+
+    def _dumps_line(value) -> bytes:
+        return orjson.dumps(
+            value, default=json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    def _dumps_line(value) -> bytes:
+        return (json.dumps(value, default=json_default) + "\n").encode("utf-8")
+
+    _loads = json.loads  # type: ignore[assignment]
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional speedup
+    ormsgpack = None  # type: ignore[assignment]
+
+
+def _msgpack_dumps(value) -> bytes:
+    return ormsgpack.packb(value, default=decoded_default, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+# printjson encoders, selected with --wire or OB_WIRE
+WIRE_FORMATS = ("json", "msgpack")
+_wire_encoders = {"json": _dumps_line}
+if ormsgpack is not None:
+    _wire_encoders["msgpack"] = _msgpack_dumps
+_encode_output = _dumps_line
 
-# Setup logging
-log = setup_logging()
+# Handlers are installed by _interactive_setup
+log = logging.getLogger("osintbuddy")
 
-DEFAULT_ENTITIES = [
+
+def _interactive_setup() -> None:
+    """Install the Rich traceback and log handlers for interactive use."""
+    from rich.traceback import install as install_traceback
+
+    from osintbuddy.cli.console import err_console
+    from osintbuddy.cli.logging import setup_logging
+
+    install_traceback(show_locals=True, console=err_console)
+    setup_logging()
+
+
+def _exit_error(message: str, code: str) -> NoReturn:
+    """Print a command-line usage error and exit with status 1."""
+    from osintbuddy.cli.display import print_error
+
+    print_error(message, code=code)
+    sys.exit(1)
+
+
+DEFAULT_ENTITIES = (
     "cse_result.py",
     "cse_search.py",
     "dns.py",
@@ -78,38 +131,104 @@ DEFAULT_ENTITIES = [
     "username.py",
     "username_profile.py",
     "whois.py",
-    "website.py"
-]
+    "website.py",
+)
 
+ENTITIES_BASE_URL = "https://raw.githubusercontent.com/osintbuddy/entities/refs/heads/main/"
+PLUGINS_DIR = Path("./plugins")
 
+# (name, destination, url) of each default entity, built once
+_ENTITY_TARGETS = tuple(
+    (entity, PLUGINS_DIR / entity, ENTITIES_BASE_URL + entity) for entity in DEFAULT_ENTITIES
+)
+
+# Maximum number of default entities downloaded at once by `ob init`
+DOWNLOAD_CONCURRENCY = 8
+
+# Registry snapshots reused by later read-only commands, one file per plugins directory
+REGISTRY_CACHE_DIR = Path.home() / ".osintbuddy" / "cache"
+SOURCE_READ_WORKERS = 8
+
+
+_http_client: httpx.AsyncClient | None = None
 
 
-def load_git_entities() -> None:
-    """Download default entities from GitHub."""
+def get_http_client() -> httpx.AsyncClient:
+    """Get the CLI's shared HTTP client, creating it on first use.
+
+    Every request the CLI makes reuses its pooled HTTP/2 connections, so
+    TLS handshakes are paid once per host. The client belongs to the
+    event loop it is first used in; await close_http_client() before
+    that loop ends.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        # httpx already sends Accept-Encoding for every decoder it has
+        # (gzip and deflate, plus br/zstd when brotli/zstandard are installed)
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": f"osintbuddy-cli/{__version__}"},
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=30),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def load_git_entities() -> None:
+    """Download default entities from GitHub, several at a time."""
     import httpx
 
-    plugins_dir = Path("./plugins")
-    if not plugins_dir.is_dir():
+    if not PLUGINS_DIR.is_dir():
         log.info("Creating ./plugins directory")
-        plugins_dir.mkdir(parents=True, exist_ok=True)
-
-    with httpx.Client() as client:
-        for entity in DEFAULT_ENTITIES:
-            entity_path = plugins_dir / entity
-            if not entity_path.exists():
-                log.info(f"Downloading: {entity}")
-                try:
-                    resp = client.get(
-                        f"https://raw.githubusercontent.com/osintbuddy/entities/refs/heads/main/{entity}"
-                    )
+        PLUGINS_DIR.mkdir(parents=True, exist_ok=True)
+
+    async def fetch(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        entity: str,
+        entity_path: Path,
+        url: str,
+    ) -> None:
+        # Stream into a temporary file so a failed download leaves nothing behind
+        tmp_path = entity_path.with_suffix(".part")
+        async with semaphore:
+            log.info(f"Downloading: {entity}")
+            try:
+                async with client.stream("GET", url) as resp:
                     resp.raise_for_status()
-                    entity_path.write_text(resp.text)
-                except httpx.HTTPError as e:
-                    log.warning(f"Failed to download {entity}: {e}")
+                    with open(tmp_path, "wb") as fh:
+                        async for chunk in resp.aiter_bytes(65536):
+                            fh.write(chunk)
+            except httpx.HTTPError as e:
+                tmp_path.unlink(missing_ok=True)
+                log.warning(f"Failed to download {entity}: {e}")
+                return
+        os.replace(tmp_path, entity_path)
+
+    semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+    # HTTP/2 multiplexes the requests over a single connection
+    client = get_http_client()
+    await asyncio.gather(*(
+        fetch(client, semaphore, entity, entity_path, url)
+        for entity, entity_path, url in _ENTITY_TARGETS
+        if not entity_path.exists()
+    ))
 
 
 def init_entities() -> None:
     """Initialize default entities."""
+    from osintbuddy.cli.display import print_banner, print_success
+    from osintbuddy.cli.progress import Step, StepRunner
+
     print_banner(show_session=False)
 
     steps = [
@@ -133,27 +252,314 @@ def init_entities() -> None:
     runner = StepRunner(speed=0.8)
     runner.run_steps(steps, header_lines=["[info]Initializing OSINTBuddy entities...[/]", ""])
 
-    load_git_entities()
+    async def download() -> None:
+        try:
+            await load_git_entities()
+        finally:
+            await close_http_client()
+
+    asyncio.run(download())
     print_success(f"Loaded {len(DEFAULT_ENTITIES)} default entities to ./plugins/")
 
 
+def set_wire_format(name: str) -> None:
+    """Select how printjson encodes output: "json" (default) or "msgpack".
+
+    MessagePack documents are self-delimiting, so they are written without
+    a trailing newline. Requires ormsgpack.
+    """
+    global _encode_output
+    if name not in WIRE_FORMATS:
+        raise ValueError(f"Unknown wire format: {name}")
+    if name not in _wire_encoders:
+        raise ValueError(f"The {name} wire format requires ormsgpack (pip install 'osintbuddy[speedups]')")
+    _encode_output = _wire_encoders[name]
+
+
 def printjson(value) -> None:
     """Legacy JSON output (for backwards compatibility)."""
-    print(json.dumps(value))
+    flush_progress()
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        # Text-only stream: binary wire formats can't be written to it
+        stdout.write(_dumps_line(value).decode("utf-8"))
+        return
+    # Flush pending text first so the raw bytes land after it
+    stdout.flush()
+    buffer.write(_encode_output(value))
+
+
+def _printjson_error(error: str, code: str, details: dict | None = None) -> None:
+    """Plain-output counterpart of emit_error (details are not printed)."""
+    printjson({"error": error, "code": code})
+
+
+# Instances of ``reusable`` plugins, shared by every run_transform call
+_plugin_instances: dict[type, object] = {}
+
+
+# (plugins path, fingerprint) of the plugins currently in the Registry
+_last_load: tuple[str, str] | None = None
 
 
 def prepare_run(plugins_path: str | None = None) -> dict:
-    """Prepare registry for a run by loading plugins."""
+    """Prepare registry for a run by loading plugins.
+
+    Calling it again for the same path is a directory scan: the plugins
+    are only reloaded once a plugin file is added, removed or modified.
+    """
+    global _last_load
+    from osintbuddy.plugins import Registry, load_plugins_fs
+
     if plugins_path is None:
         plugins_path = os.getcwd() + '/plugins'
 
+    current = (plugins_path, _plugins_fingerprint(plugins_path))
+    if current == _last_load:
+        return Registry.plugins
+
+    _clear_registry()
+    plugins = load_plugins_fs(plugins_path)
+    _last_load = current
+    return plugins
+
+
+def _plugin_counts() -> tuple[int, int]:
+    """Number of entities and transforms currently in the Registry."""
+    from osintbuddy.plugins import Registry
+
+    transform_count = sum(len(m) for buckets in Registry.transforms_map.values() for _, m in buckets)
+    return len(Registry.plugins), transform_count
+
+
+def _clear_registry() -> None:
+    global _last_load
+    from osintbuddy.plugins import Registry
+
+    _last_load = None
     Registry.labels.clear()
     Registry.plugins.clear()
     Registry.ui_labels.clear()
     if hasattr(Registry, "transforms_map"):
         Registry.transforms_map.clear()
+    _plugin_instances.clear()
+    clear_plugin_infos()
+
+
+def prepare_entity_run(
+    entity_label: str, plugins_path: str | None = None, use_cache: bool = True
+) -> tuple[int, int]:
+    """Load the plugins needed to run transforms on one entity.
+
+    With a current registry snapshot, only the entity's own module and the
+    modules that register its transforms are imported. Otherwise, or if
+    the snapshot doesn't know the entity, every plugin is loaded with
+    prepare_run.
+
+    Returns:
+        The number of entities and transforms in the whole plugins
+        directory (taken from the snapshot after a partial load)
+    """
+    from osintbuddy.plugins import Registry, load_entity_file, load_transform_file
+    from osintbuddy.utils import to_snake_case
+
+    if plugins_path is None:
+        plugins_path = os.getcwd() + '/plugins'
+    # Already fully loaded: prepare_run only rescans
+    if not use_cache or (_last_load is not None and _last_load[0] == plugins_path):
+        prepare_run(plugins_path)
+        return _plugin_counts()
+
+    key = to_snake_case(entity_label.split("@", 1)[0])
+    snapshot = load_registry_snapshot(plugins_path)
+    if _last_load is not None and _last_load[0] == plugins_path:
+        # The snapshot was stale and rebuilt, which loaded everything
+        return _plugin_counts()
+    entity = snapshot['entities'].get(key)
+    modules = entity.get('modules') if entity else None
+    if not modules:
+        prepare_run(plugins_path)
+        return _plugin_counts()
+
+    _clear_registry()
+    for path in modules:
+        if os.path.basename(os.path.dirname(path)) == "entities":
+            load_entity_file(path)
+        else:
+            load_transform_file(path)
+    if key not in Registry.plugins:
+        prepare_run(plugins_path)
+        return _plugin_counts()
+    entities = snapshot['entities']
+    transform_count = snapshot.get('transform_count')
+    if transform_count is None:
+        transform_count = sum(len(e.get('transforms', ())) for e in entities.values())
+    return len(entities), transform_count
+
+
+def _plugins_fingerprint(plugins_path: str) -> str:
+    """Digest the path, size and mtime of every file under the plugins directory.
+
+    Covers helper modules and data files the plugins read next to
+    entities/ and transforms/, not just the files load_plugins_fs imports.
+    Hidden directories and __pycache__ are skipped.
+    """
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(plugins_path):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__" and not d.startswith(".")]
+        rel_dir = os.path.relpath(dirpath, plugins_path)
+        for name in filenames:
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            files.append((rel_dir, name, stat.st_size, stat.st_mtime_ns))
+    files.sort()
+    digest.update(repr(files).encode())
+    return digest.hexdigest()
+
+
+def _read_sources(paths: list[str], stats: Mapping[str, os.stat_result | None], missing_ok: bool = False) -> list[str | None]:
+    """Read plugin module sources, in ``paths`` order, on a small thread pool.
+
+    Unreadable files raise, or give None when ``missing_ok`` is set.
+    """
+    def read(path: str) -> str | None:
+        stat = stats[path]
+        try:
+            return read_source(path, stat and stat.st_mtime_ns)
+        except Exception:
+            if missing_ok:
+                return None
+            raise
+
+    if len(paths) < 2:
+        return [read(path) for path in paths]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(SOURCE_READ_WORKERS, len(paths))) as pool:
+        return list(pool.map(read, paths))
+
+
+def _entity_modules(module_file: str, mapping: Mapping[str, Any]) -> list[str] | None:
+    """Files to import to run an entity's transforms, or None if one is unknown."""
+    modules = [module_file]
+    for fn in mapping.values():
+        path = getattr(sys.modules.get(getattr(fn, "__module__", "")), "__file__", None)
+        if path is None:
+            return None
+        if path not in modules:
+            modules.append(path)
+    return modules
+
+
+def _registry_snapshot() -> dict:
+    """Capture the loaded registry as plain, JSON-serializable data."""
+    from osintbuddy.plugins import Registry
+
+    entities = {}
+    for key, plugin_cls in Registry.plugins.items():
+        info = plugin_info(plugin_cls)
+        try:
+            # Everything but the random id, which is regenerated per use
+            blueprint = plugin_cls.blueprint()
+            blueprint.pop('id', None)
+        except Exception:
+            blueprint = None
+        mapping = Registry.find_transforms(info.entity_id, info.version) or {}
+        entities[key] = {
+            'id': info.entity_id,
+            'label': info.label,
+            'version': info.version,
+            'author': info.author,
+            'description': info.description,
+            'category': info.category,
+            'tags': info.tags,
+            'source_path': info.module_file,
+            'modules': _entity_modules(info.module_file, mapping),
+            'blueprint': blueprint,
+            'transforms': [transform_info(fn) for fn in mapping.values()],
+        }
+    return {'entities': entities, 'transform_count': _plugin_counts()[1]}
+
+
+def _blueprint(entity: dict) -> dict | None:
+    """Build a snapshot entity's blueprint from its template, with a fresh id."""
+    template = entity['blueprint']
+    if template is None:
+        return None
+    return {'id': str(uuid4()), **template}
+
+
+def load_registry_snapshot(plugins_path: str | None = None, use_cache: bool = True) -> dict:
+    """Get a plain-data snapshot of the plugins for read-only commands.
+
+    The snapshot is stored as JSON under REGISTRY_CACHE_DIR and reused by
+    later invocations until a plugin file is added, removed or modified,
+    so listing commands skip importing the plugins. A cache file that
+    can't be read or decoded is rebuilt. Pass use_cache=False
+    (``--no-cache``) to always load the plugins.
+    """
+    if plugins_path is None:
+        plugins_path = os.getcwd() + '/plugins'
+    if not use_cache:
+        prepare_run(plugins_path)
+        return _registry_snapshot()
+
+    fingerprint = _plugins_fingerprint(plugins_path)
+    path_digest = hashlib.blake2b(os.path.abspath(plugins_path).encode(), digest_size=8).hexdigest()
+    cache_path = REGISTRY_CACHE_DIR / f"registry-{path_digest}.json"
+    try:
+        with open(cache_path, "rb") as f:
+            cached = _loads(f.read())
+        snapshot = cached.get('snapshot')
+        if cached.get('fingerprint') == fingerprint and isinstance(snapshot, dict):
+            return snapshot
+    except (OSError, ValueError, AttributeError):
+        # Missing, corrupt or not a snapshot: rebuild it
+        pass
+
+    prepare_run(plugins_path)
+    snapshot = _registry_snapshot()
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        REGISTRY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps_line({'fingerprint': fingerprint, 'snapshot': snapshot}))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError) as e:
+        # TypeError: a plugin attribute that isn't JSON serializable
+        tmp_path.unlink(missing_ok=True)
+        log.debug(f"Could not write registry cache: {e}")
+    return snapshot
+
+
+async def _stream_items(stream, edge_label: str, complete: bool = False):
+    """Normalized entities from a generator transform, chunk by chunk.
+
+    Yielded ProgressEvents are emitted as progress instead. With
+    ``complete``, "Complete" progress is emitted once the transform is
+    exhausted, before the caller writes the end of the result.
+    """
+    from osintbuddy.results import normalize_result
 
-    return load_plugins_fs(plugins_path)
+    async def chunks():
+        if hasattr(stream, "__aiter__"):
+            async for chunk in stream:
+                yield chunk
+        else:
+            for chunk in stream:
+                yield chunk
+
+    async for chunk in chunks():
+        if isinstance(chunk, ProgressEvent):
+            emit_progress(chunk.message, chunk.percent, chunk.stage)
+            continue
+        for item in normalize_result(chunk, default_edge_label=edge_label):
+            yield item
+    if complete:
+        emit_progress("Complete", 100)
 
 
 async def run_transform(
@@ -163,6 +569,7 @@ async def run_transform(
     cfg: str | None = None,
     structured: bool = False,
     interactive: bool = True,
+    use_cache: bool = True,
 ) -> None:
     """Run a transform on an entity.
 
@@ -173,15 +580,27 @@ async def run_transform(
         cfg: Optional config JSON string
         structured: If True, use structured output with delimiters
         interactive: If True, show animated progress
+        use_cache: If True, import only the entity's plugin modules when
+            the registry snapshot is current (see prepare_entity_run)
     """
+    from osintbuddy.errors import ErrorCode, PluginError
+    from osintbuddy.plugins import Registry, TransformPayload, transform_meta
+    from osintbuddy.results import normalize_result
+    from osintbuddy.utils import to_snake_case
+    if interactive:
+        from osintbuddy.cli.console import console
+        from osintbuddy.cli.display import print_error, print_info, print_success
+        from osintbuddy.cli.progress import PluginLoadProgress, TransformProgress
+
     output_fn = emit_result if structured else printjson
-    error_fn = emit_error if structured else lambda e, c, d=None: printjson({"error": e, "code": c})
+    error_fn = emit_error if structured else _printjson_error
 
     try:
-        src = json.loads(source)
+        src = _loads(source)
     except json.JSONDecodeError as e:
         error_fn(f"Invalid JSON payload: {e}", ErrorCode.INVALID_INPUT.value)
         if interactive:
+            from rich.syntax import Syntax
             print_error("Invalid JSON payload", code="INVALID_INPUT", details={"error": str(e)})
             console.print()
             console.print("[muted]Expected format:[/]")
@@ -193,15 +612,6 @@ async def run_transform(
         return
 
     try:
-        with PluginLoadProgress() as progress:
-            progress.update("Loading plugins...")
-            prepare_run(plugins_path)
-            entity_count = len(Registry.plugins)
-            transform_count = sum(
-                len(m) for buckets in Registry.transforms_map.values() for _, m in buckets
-            )
-            progress.complete(entity_count, transform_count)
-
         # Support both flat and nested payload formats
         # Flat: {"label": "...", "transform": "...", "data": {...}}
         # Nested: {"entity": {"transform": "...", "data": {"label": "...", ...}}}
@@ -228,6 +638,15 @@ async def run_transform(
                 print_error("Missing entity label", code="INVALID_INPUT")
             return
 
+        if interactive:
+            with PluginLoadProgress() as progress:
+                progress.update("Loading plugins...")
+                entity_count, transform_count = prepare_entity_run(source_entity_label, plugins_path, use_cache)
+                progress.complete(entity_count, transform_count)
+        else:
+            # No spinner (or Rich live display) for machine consumers
+            prepare_entity_run(source_entity_label, plugins_path, use_cache)
+
         snake_label = to_snake_case(source_entity_label)
         plugin_cls = await Registry.get_entity(snake_label)
         if plugin_cls is None:
@@ -260,17 +679,16 @@ async def run_transform(
         # Prepare entity argument
         entity_dict = entity_payload
         entity_data = entity_dict.get("data", {})
-        entity_arg = TransformPayload(**{
-            **{to_snake_case(k): v for k, v in entity_data.items()},
-            "id": entity_dict.get("id"),
-            "label": entity_data.get("label")
-        })
+        fields = {to_snake_case(k): v for k, v in entity_data.items()}
+        fields["id"] = entity_dict.get("id")
+        fields["label"] = entity_data.get("label")
+        entity_arg = TransformPayload.model_validate(fields)
 
         # Parse cfg if provided
         cfg_obj = None
         if cfg:
             try:
-                cfg_obj = json.loads(cfg)
+                cfg_obj = _loads(cfg)
             except json.JSONDecodeError:
                 cfg_obj = cfg
 
@@ -285,11 +703,14 @@ async def run_transform(
             ensure_deps(tuple(deps))
 
         # Execute transform
-        plugin_instance = plugin_cls()
-        sig = inspect.signature(transform_fn)
-        kwargs = {}
-        if "cfg" in sig.parameters:
+        # Decided from the signature, so a TypeError raised inside the
+        # transform is reported instead of triggering a retry without self
+        kwargs: dict[str, Any] = {"entity": entity_arg}
+        meta = transform_meta(transform_fn)
+        if meta["takes_cfg"]:
             kwargs["cfg"] = cfg_obj
+        if meta["needs_self"]:
+            kwargs["self"] = plugin_instance(_plugin_instances, plugin_cls)
 
         if structured:
             emit_progress(f"Running transform: {transform_label}", 50)
@@ -297,28 +718,32 @@ async def run_transform(
         if interactive:
             with TransformProgress(transform_label) as progress:
                 progress.update(f"Executing {transform_label}...", 30)
-                try:
-                    result = await transform_fn(self=plugin_instance, entity=entity_arg, **kwargs)
-                except TypeError:
-                    result = await transform_fn(entity=entity_arg, **kwargs)
+                result = transform_fn(**kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
                 progress.update("Normalizing results...", 80)
         else:
-            try:
-                result = await transform_fn(self=plugin_instance, entity=entity_arg, **kwargs)
-            except TypeError:
-                result = await transform_fn(entity=entity_arg, **kwargs)
+            result = transform_fn(**kwargs)
+            if inspect.isawaitable(result):
+                result = await result
 
         # Normalize result
         edge_label = getattr(transform_fn, "edge_label", tkey)
-        normalized = normalize_result(result, default_edge_label=edge_label)
-
-        if structured:
-            emit_progress("Complete", 100)
-
-        output_fn(normalized)
+        streamed = inspect.isasyncgen(result) or inspect.isgenerator(result)
+        if streamed and structured:
+            # Written as the transform yields, never held as one list
+            result_count = await emit_result_astream(_stream_items(result, edge_label, complete=True))
+        else:
+            if streamed:
+                normalized = [item async for item in _stream_items(result, edge_label)]
+            else:
+                normalized = normalize_result(result, default_edge_label=edge_label)
+            if structured:
+                emit_progress("Complete", 100)
+            output_fn(normalized)
+            result_count = len(normalized)
 
         if interactive:
-            result_count = len(normalized) if isinstance(normalized, list) else 1
             print_success(f"Transform complete: {result_count} result(s)")
 
     except PluginError as e:
@@ -335,52 +760,32 @@ async def list_transforms(
     label: str,
     plugins_path: str | None = None,
     interactive: bool = True,
+    use_cache: bool = True,
 ) -> list[dict]:
     """List transforms available for an entity."""
-    prepare_run(plugins_path)
+    if interactive:
+        from osintbuddy.cli.display import print_info, print_transforms_table, print_warning
+    snapshot = load_registry_snapshot(plugins_path, use_cache)
 
     if not label:
         printjson([])
         return []
 
-    snake_label = to_snake_case(label)
-    plugin_cls = await Registry.get_entity(snake_label)
-    if plugin_cls is None:
+    from osintbuddy.utils import to_snake_case
+    entity = snapshot['entities'].get(to_snake_case(label.split("@", 1)[0]))
+    if entity is None:
         printjson([])
         if interactive:
             print_warning(f"Entity not found: {label}")
         return []
 
-    entity_id = getattr(plugin_cls, "entity_id", None) or to_snake_case(plugin_cls.label)
-    entity_version = getattr(plugin_cls, "version", "0")
-    mapping = Registry.find_transforms(entity_id, entity_version)
-
-    if not mapping:
+    transforms: list[dict] = entity['transforms']
+    if not transforms:
         printjson([])
         if interactive:
             print_info(f"No transforms registered for {label}")
         return []
 
-    transforms = []
-    for fn in mapping.values():
-        transform_info = {
-            "label": getattr(fn, "label", "unknown"),
-            "icon": getattr(fn, "icon", "list"),
-            "edge_label": getattr(fn, "edge_label", getattr(fn, "label", "unknown")),
-        }
-        if deps := getattr(fn, "deps", None):
-            transform_info["deps"] = deps
-        if accepts := getattr(fn, "accepts", None):
-            transform_info["accepts"] = accepts
-        if produces := getattr(fn, "produces", None):
-            transform_info["produces"] = produces
-        if settings := getattr(fn, "settings", None):
-            transform_info["settings"] = [
-                {"name": s.name, "display_name": s.display_name, "required": s.required}
-                for s in settings
-            ]
-        transforms.append(transform_info)
-
     printjson(transforms)
 
     if interactive:
@@ -389,35 +794,45 @@ async def list_transforms(
     return transforms
 
 
-def list_plugins(plugins_path: str | None = None, interactive: bool = True) -> None:
+def list_plugins(
+    plugins_path: str | None = None,
+    interactive: bool = True,
+    use_cache: bool = True,
+) -> None:
     """List all loaded plugins."""
-    plugins = prepare_run(plugins_path)
-    loaded_plugins = [to_snake_case(p.label) for p in plugins.values()]
+    loaded_plugins = list(load_registry_snapshot(plugins_path, use_cache)['entities'])
     printjson(loaded_plugins)
 
     if interactive:
+        from osintbuddy.cli.console import console
         console.print()
         console.print(f"[info]Loaded {len(loaded_plugins)} plugins[/]")
         for plugin in loaded_plugins:
             console.print(f"  [entity]- {plugin}[/]")
 
 
-def list_entities(plugins_path: str | None = None, interactive: bool = True) -> None:
+def list_entities(
+    plugins_path: str | None = None,
+    interactive: bool = True,
+    use_cache: bool = True,
+    include_source: bool = True,
+) -> None:
     """Return a lightweight list of entities."""
-    prepare_run(plugins_path)
+    snapshot = load_registry_snapshot(plugins_path, use_cache)
+    entities = snapshot['entities'].values()
+    paths = [entity['source_path'] for entity in entities]
+    # A file module_stats couldn't find raises here, as a direct stat would
+    stats = {path: stat or os.stat(path) for path, stat in module_stats(paths).items()}
+    sources = _read_sources(paths, stats) if include_source else [None] * len(paths)
     plugins = []
 
-    for plugin in Registry.plugins.values():
-        path = f"{sys.modules[plugin.__module__].__file__}"
-        with open(path, "r") as fh:
-            source = fh.read()
-        last_file_edit = datetime.utcfromtimestamp(
-            os.path.getmtime(path)
-        ).strftime('%Y-%m-%d %H:%M:%S')
+    for entity, source in zip(entities, sources, strict=True):
+        stat = stats[entity['source_path']]
+        last_file_edit = last_edit(stat.st_mtime)
         plugins.append(dict(
-            label=getattr(plugin, 'label', 'unknown'),
-            author=getattr(plugin, 'author', 'Unknown author'),
-            description=getattr(plugin, 'description', 'No description found...'),
+            label=entity['label'],
+            author=entity['author'],
+            description=entity['description'],
             source=source,
             last_edit=last_file_edit,
         ))
@@ -425,67 +840,52 @@ def list_entities(plugins_path: str | None = None, interactive: bool = True) ->
     printjson(plugins)
 
     if interactive:
+        from osintbuddy.cli.display import print_entities_table
         print_entities_table(plugins)
 
 
-def entities_json(plugins_path: str | None = None) -> None:
+def entities_json(
+    plugins_path: str | None = None,
+    use_cache: bool = True,
+    include_source: bool = True,
+) -> None:
     """Dump full entity information as JSON suitable for UI display."""
-    def iso8601(ts: float) -> str:
-        return datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-
-    prepare_run(plugins_path)
+    snapshot = load_registry_snapshot(plugins_path, use_cache)
+    entities = snapshot['entities'].values()
+    paths = [entity['source_path'] for entity in entities]
+    stats = module_stats(paths)
+    if include_source:
+        sources = _read_sources(paths, stats, missing_ok=True)
+    else:
+        sources = [None] * len(paths)
     results = []
 
-    for plugin_cls in Registry.plugins.values():
-        module_file = f"{sys.modules[plugin_cls.__module__].__file__}"
-        try:
-            with open(module_file, 'r') as fh:
-                source = fh.read()
-        except Exception:
-            source = None
-        try:
-            stat = os.stat(module_file)
+    for entity, source in zip(entities, sources, strict=True):
+        module_file = entity['source_path']
+        stat = stats[module_file]
+        if stat is not None:
             ctime = iso8601(stat.st_ctime)
             mtime = iso8601(stat.st_mtime)
-        except Exception:
+        else:
             ctime = None
             mtime = None
 
-        label = getattr(plugin_cls, 'label', 'unknown')
-        entity_id = getattr(plugin_cls, 'entity_id', None) or to_snake_case(label)
-        version = getattr(plugin_cls, 'version', '0')
-        author = getattr(plugin_cls, 'author', 'Unknown author')
-        description = getattr(plugin_cls, 'description', 'No description found...')
-        category = getattr(plugin_cls, 'category', '')
-        tags = getattr(plugin_cls, 'tags', [])
-
-        try:
-            blueprint = plugin_cls.blueprint()
-        except Exception:
-            blueprint = None
-
-        mapping = Registry.find_transforms(entity_id, version) or {}
-        transforms = []
-        for fn in mapping.values():
-            transforms.append({
-                'label': getattr(fn, 'label', 'unknown'),
-                'icon': getattr(fn, 'icon', 'list'),
-                'edge_label': getattr(fn, 'edge_label', getattr(fn, 'label', 'unknown')),
-            })
-
         results.append({
-            'id': entity_id,
-            'label': label,
-            'description': description,
-            'author': author,
-            'category': category,
-            'tags': tags,
+            'id': entity['id'],
+            'label': entity['label'],
+            'description': entity['description'],
+            'author': entity['author'],
+            'category': entity['category'],
+            'tags': entity['tags'],
             'source': source,
             'source_path': module_file,
             'ctime': ctime,
             'mtime': mtime,
-            'blueprint': blueprint,
-            'transforms': transforms,
+            'blueprint': _blueprint(entity),
+            'transforms': [
+                {'label': t['label'], 'icon': t['icon'], 'edge_label': t['edge_label']}
+                for t in entity['transforms']
+            ],
         })
 
     payload = {
@@ -498,26 +898,24 @@ def entities_json(plugins_path: str | None = None) -> None:
 async def get_blueprints(
     label: str | None = None,
     plugins_path: str | None = None,
-) -> dict:
-    """Get entity blueprints."""
+    use_cache: bool = True,
+) -> dict | list:
+    """Get entity blueprints; an unknown label gives an empty list."""
     blueprints = {}
-    prepare_run(plugins_path)
+    snapshot = load_registry_snapshot(plugins_path, use_cache)
 
     if label is None:
-        plugins = [
-            await Registry.get_entity(to_snake_case(lbl))
-            for lbl in Registry.labels
-        ]
-        for entity in plugins:
-            blueprint = entity.blueprint()
-            blueprints[blueprint.get('label')] = blueprint
+        for entity in snapshot['entities'].values():
+            if (blueprint := _blueprint(entity)) is not None:
+                blueprints[blueprint.get('label')] = blueprint
         printjson(blueprints)
         return blueprints
 
-    plugin = await Registry.get_entity(label)
-    blueprint = plugin.blueprint() if plugin else []
-    printjson(blueprint)
-    return blueprint
+    from osintbuddy.utils import to_snake_case
+    entity = snapshot['entities'].get(to_snake_case(label.split("@", 1)[0]))
+    found: dict | list = (_blueprint(entity) if entity else None) or []
+    printjson(found)
+    return found
 
 
 def compile_entity_cmd(
@@ -528,6 +926,8 @@ def compile_entity_cmd(
 ) -> None:
     """Compile a JSON entity definition to Python."""
     from osintbuddy.compiler import compile_file
+    if interactive:
+        from osintbuddy.cli.display import print_info, print_success
 
     if interactive:
         print_info(f"Compiling: {json_path}")
@@ -551,6 +951,9 @@ def compile_directory_cmd(
 ) -> None:
     """Compile all JSON entities in a directory."""
     from osintbuddy.compiler import compile_directory
+    if interactive:
+        from osintbuddy.cli.console import console
+        from osintbuddy.cli.display import print_info, print_success
 
     if interactive:
         print_info(f"Compiling directory: {json_dir}")
@@ -603,16 +1006,23 @@ Examples:
     parser.add_argument('--structured', action='store_true', help="Use structured output with delimiters")
     parser.add_argument('--no-interactive', action='store_true', help="Disable interactive output")
     parser.add_argument('--quiet', '-q', action='store_true', help="Minimal output")
+    parser.add_argument(
+        '--wire', choices=WIRE_FORMATS, default=os.environ.get('OB_WIRE', 'json'),
+        help="Encoding of plain command output (default: $OB_WIRE or json)",
+    )
+    parser.add_argument('--no-cache', action='store_true', help="Always reload plugins instead of using the registry cache; "
+                        "use when editing helper modules imported from outside the plugins directory")
+    parser.add_argument('--no-source', action='store_true', help="Leave plugin source out of entity listings")
     parser.add_argument('-e', '--entities', action='store_true', help="List entities")
     parser.add_argument('-t', '--transforms', action='store_true', help="List transforms")
 
     args = parser.parse_args()
 
     if args.entities and args.transforms:
-        print_error("Choose one of --entities or --transforms", code="INVALID_ARGUMENTS")
-        sys.exit(1)
+        _exit_error("Choose one of --entities or --transforms", "INVALID_ARGUMENTS")
 
     if not args.command and not args.entities and not args.transforms:
+        from osintbuddy.cli.display import print_banner
         print_banner(show_session=False)
         parser.print_help()
         return
@@ -644,9 +1054,19 @@ Examples:
 
     command = commands.get(cmd_fn_key)
 
+    try:
+        set_wire_format(args.wire)
+    except ValueError as e:
+        _exit_error(str(e), "INVALID_ARGUMENTS")
+
     interactive = not args.no_interactive and not args.quiet
+    use_cache = not args.no_cache
+    if interactive:
+        _interactive_setup()
 
     if command is None:
+        from osintbuddy.cli.console import console
+        from osintbuddy.cli.display import print_error
         print_error(f"Unknown command: {cmd_fn_key}", code="INVALID_COMMAND")
         console.print()
         console.print("[muted]Available commands:[/]")
@@ -659,40 +1079,42 @@ Examples:
 
     if cmd_fn_key == "transform":
         if not payload:
-            print_error("Missing transform payload", code="MISSING_ARGUMENT")
-            sys.exit(1)
+            _exit_error("Missing transform payload", "MISSING_ARGUMENT")
         asyncio.run(command(
             plugins_path=plugins_path,
             source=payload,
             cfg=args.config,
             structured=args.structured,
             interactive=interactive,
+            use_cache=use_cache,
         ))
     elif cmd_fn_key == "plugins":
-        command(plugins_path=plugins_path, interactive=interactive)
+        command(plugins_path=plugins_path, interactive=interactive, use_cache=use_cache)
     elif cmd_fn_key == "entities":
-        command(plugins_path=plugins_path, interactive=interactive)
+        command(
+            plugins_path=plugins_path,
+            interactive=interactive,
+            use_cache=use_cache,
+            include_source=not args.no_source,
+        )
     elif cmd_fn_key == "entities json":
-        command(plugins_path=plugins_path)
+        command(plugins_path=plugins_path, use_cache=use_cache, include_source=not args.no_source)
     elif cmd_fn_key == "transforms":
         if not label:
-            print_error("Missing entity label (-L)", code="MISSING_ARGUMENT")
-            sys.exit(1)
-        asyncio.run(command(label=label, plugins_path=plugins_path, interactive=interactive))
+            _exit_error("Missing entity label (-L)", "MISSING_ARGUMENT")
+        asyncio.run(command(label=label, plugins_path=plugins_path, interactive=interactive, use_cache=use_cache))
     elif cmd_fn_key == "blueprints":
-        asyncio.run(command(plugins_path=plugins_path, label=label))
+        asyncio.run(command(plugins_path=plugins_path, label=label, use_cache=use_cache))
     elif cmd_fn_key == "compile dir":
         if compile_dir_path:
             compile_directory_cmd(compile_dir_path, args.output, args.version, interactive)
         else:
-            print_error("compile dir requires a directory path", code="MISSING_ARGUMENT")
-            sys.exit(1)
+            _exit_error("compile dir requires a directory path", "MISSING_ARGUMENT")
     elif cmd_fn_key == "compile":
         if compile_path:
             compile_entity_cmd(compile_path, args.output, args.version, interactive)
         else:
-            print_error("compile requires a JSON path", code="MISSING_ARGUMENT")
-            sys.exit(1)
+            _exit_error("compile requires a JSON path", "MISSING_ARGUMENT")
     else:
         command()
 
@@ -20,10 +20,56 @@ Output Format:
 """
 from __future__ import annotations
 
+import atexit
 import json
+import queue
 import sys
+import threading
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, AsyncIterable, Callable, Iterable, TextIO
+
+from osintbuddy.results import RawJSON
+
+try:
+    import orjson
+
+    # orjson >= 3.9.14 splices pre-serialized JSON into a document as-is
+    _embed_raw = getattr(orjson, "Fragment", None) or orjson.loads
+    _parse_raw = orjson.loads
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_pretty(data: Any) -> bytes:
+        return orjson.dumps(
+            data, default=json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+except ImportError:  # pragma: no cover - optional speedup
+    _embed_raw = _parse_raw = json.loads  # type: ignore[assignment]
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, default=json_default).encode("utf-8")
+
+    def _dumps_pretty(data: Any) -> bytes:
+        return json.dumps(data, indent=2, default=json_default).encode("utf-8")
+
+
+def json_default(obj: Any) -> Any:
+    """``default=`` hook for JSON encoders: embeds RawJSON values.
+
+    Without orjson.Fragment the raw bytes are parsed and re-encoded.
+    """
+    if isinstance(obj, RawJSON):
+        return _embed_raw(obj.data)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def decoded_default(obj: Any) -> Any:
+    """``default=`` hook for non-JSON encoders (e.g. msgpack): parses RawJSON."""
+    if isinstance(obj, RawJSON):
+        return _parse_raw(obj.data)
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
 
 
 # Output delimiters
@@ -33,13 +79,97 @@ ERROR_START = "---OSIB_ERROR_START---"
 ERROR_END = "---OSIB_ERROR_END---"
 PROGRESS_PREFIX = "---OSIB_PROGRESS---"
 
-_progress_callback: Callable[[dict[str, Any]], None] | None = None
+# Encoded once, with the newlines that surround each payload, for writers
+# and for readers of the raw byte stream
+JSON_START_BYTES = f"{JSON_START}\n".encode()
+JSON_END_BYTES = f"\n{JSON_END}\n".encode()
+ERROR_START_BYTES = f"{ERROR_START}\n".encode()
+ERROR_END_BYTES = f"\n{ERROR_END}\n".encode()
+PROGRESS_PREFIX_BYTES = PROGRESS_PREFIX.encode()
+_NEWLINE_B = b"\n"
+
+# A context variable, so concurrent transforms each report to their own callback
+_progress_callback: ContextVar[Callable[[dict[str, Any]], None] | None] = ContextVar(
+    "osib_progress_callback", default=None
+)
 
 
 def set_progress_callback(callback: Callable[[dict[str, Any]], None] | None) -> None:
-    """Register a callback to receive progress events."""
-    global _progress_callback
-    _progress_callback = callback
+    """Register a callback to receive progress events in the current context."""
+    _progress_callback.set(callback)
+
+
+# Progress lines go to stderr from a daemon thread, so emitters never wait
+# on the stream. A backlog longer than this collapses to its newest line.
+PROGRESS_BACKLOG = 16
+
+# Items are (stream, encoded line) pairs, or Events set by flush_progress
+_progress_queue: queue.SimpleQueue[tuple[TextIO, bytes] | threading.Event] | None = None
+_progress_lock = threading.Lock()
+
+
+def _progress_writer(q: queue.SimpleQueue[tuple[TextIO, bytes] | threading.Event]) -> None:
+    while True:
+        batch = [q.get()]
+        if q.qsize() > PROGRESS_BACKLOG:
+            try:
+                while True:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            markers = [item for item in batch if isinstance(item, threading.Event)]
+            lines = [item for item in batch if not isinstance(item, threading.Event)]
+            batch = lines[-1:] + markers
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            stream, line = item
+            try:
+                _write(stream, PROGRESS_PREFIX_BYTES, line, _NEWLINE_B)
+            except Exception:
+                pass
+
+
+def _progress_put(stream: TextIO, line: bytes) -> None:
+    global _progress_queue
+    if _progress_queue is None:
+        with _progress_lock:
+            if _progress_queue is None:
+                q: queue.SimpleQueue[tuple[TextIO, bytes] | threading.Event] = queue.SimpleQueue()
+                threading.Thread(
+                    target=_progress_writer, args=(q,), name="osib-progress", daemon=True
+                ).start()
+                atexit.register(flush_progress)
+                _progress_queue = q
+    _progress_queue.put_nowait((stream, line))
+
+
+def flush_progress(timeout: float = 5.0) -> None:
+    """Wait until progress queued so far has been written (or dropped)."""
+    if _progress_queue is None:
+        return
+    done = threading.Event()
+    _progress_queue.put_nowait(done)
+    done.wait(timeout)
+
+
+def _write(stream: TextIO, *parts: bytes) -> None:
+    """Write encoded output to a text stream's binary buffer and flush it.
+
+    Pending text is flushed first so everything stays in order. Streams
+    without a buffer (e.g. a StringIO swapped in by a caller) get the
+    decoded text instead.
+    """
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(b"".join(parts).decode("utf-8"))
+        stream.flush()
+        return
+    stream.flush()
+    for part in parts:
+        buffer.write(part)
+    buffer.flush()
 
 
 def emit_result(data: Any) -> None:
@@ -48,10 +178,89 @@ def emit_result(data: Any) -> None:
     Args:
         data: Data to serialize and emit
     """
-    print(JSON_START, file=sys.stdout)
-    json.dump(data, sys.stdout)
-    print(f"\n{JSON_END}", file=sys.stdout)
-    sys.stdout.flush()
+    flush_progress()
+    _write(sys.stdout, JSON_START_BYTES, _dumps(data), JSON_END_BYTES)
+
+
+# Items serialized between writes when streaming a result list
+STREAM_FLUSH_EVERY = 64
+
+
+class _ResultListWriter:
+    """Writes a delimited JSON list one item at a time, in batches."""
+
+    def __init__(self, flush_every: int):
+        self.count = 0
+        self._flush_every = max(1, flush_every)
+        self._started = False
+        self._parts: list[bytes] = [JSON_START_BYTES, b"["]
+
+    def add(self, item: Any) -> None:
+        if self.count:
+            self._parts.append(b",")
+        self._parts.append(item.data if type(item) is RawJSON else _dumps(item))
+        self.count += 1
+        if self.count % self._flush_every == 0:
+            self._flush()
+
+    def close(self) -> int:
+        self._parts += (b"]", JSON_END_BYTES)
+        self._flush()
+        return self.count
+
+    def abort(self) -> None:
+        """Stop after an error: drop the list if none of it is out yet, else close it."""
+        if self._started:
+            self.close()
+        else:
+            self._parts = []
+
+    def _flush(self) -> None:
+        # Progress emitted while items were collected goes out first
+        flush_progress()
+        _write(sys.stdout, *self._parts)
+        self._parts = []
+        self._started = True
+
+
+def emit_result_stream(items: Iterable[Any], flush_every: int = STREAM_FLUSH_EVERY) -> int:
+    """Emit a structured JSON list without building it in memory first.
+
+    Items are serialized as they arrive and written every ``flush_every``
+    items, each batch after any progress emitted before it. If ``items``
+    raises, the exception propagates: before the first batch nothing is
+    written, afterwards the list is closed with the items serialized so
+    far. A caller reporting the exception with emit_error therefore
+    writes either just the error block, or one partial result block
+    followed by it.
+
+    Args:
+        items: Data items to serialize as one list
+        flush_every: Items to buffer between writes
+
+    Returns:
+        Number of items emitted
+    """
+    writer = _ResultListWriter(flush_every)
+    try:
+        for item in items:
+            writer.add(item)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+async def emit_result_astream(items: AsyncIterable[Any], flush_every: int = STREAM_FLUSH_EVERY) -> int:
+    """Async counterpart of emit_result_stream, for async iterables."""
+    writer = _ResultListWriter(flush_every)
+    try:
+        async for item in items:
+            writer.add(item)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
 
 
 def emit_error(error: str, code: str = "UNKNOWN", details: dict[str, Any] | None = None) -> None:
@@ -69,15 +278,16 @@ def emit_error(error: str, code: str = "UNKNOWN", details: dict[str, Any] | None
     if details:
         error_data["details"] = details
 
-    print(ERROR_START, file=sys.stdout)
-    json.dump(error_data, sys.stdout)
-    print(f"\n{ERROR_END}", file=sys.stdout)
-    sys.stdout.flush()
+    flush_progress()
+    _write(sys.stdout, ERROR_START_BYTES, _dumps(error_data), ERROR_END_BYTES)
 
 
 def emit_progress(message: str, percent: int = -1, stage: str = "") -> None:
     """Emit a progress update.
 
+    The stderr line is written in the background; results and errors
+    emitted afterwards still follow it.
+
     Args:
         message: Progress message
         percent: Progress percentage (0-100, -1 for indeterminate)
@@ -90,13 +300,13 @@ def emit_progress(message: str, percent: int = -1, stage: str = "") -> None:
     if stage:
         progress_data["stage"] = stage
 
-    if _progress_callback:
+    if callback := _progress_callback.get():
         try:
-            _progress_callback(progress_data)
+            callback(progress_data)
         except Exception:
             pass
 
-    print(f"{PROGRESS_PREFIX}{json.dumps(progress_data)}", file=sys.stderr)
+    _progress_put(sys.stderr, _dumps(progress_data))
 
 
 @dataclass
@@ -121,10 +331,8 @@ def emit_json(data: Any, pretty: bool = False) -> None:
         data: Data to serialize
         pretty: If True, pretty-print the JSON
     """
-    if pretty:
-        print(json.dumps(data, indent=2))
-    else:
-        print(json.dumps(data))
+    flush_progress()
+    _write(sys.stdout, _dumps_pretty(data) if pretty else _dumps(data), _NEWLINE_B)
 
 
 class ProgressEmitter:
@@ -8,6 +8,7 @@ This module provides the core plugin infrastructure including:
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import importlib
 import importlib.util
@@ -94,6 +95,8 @@ class Registry(type):
     labels: ClassVar[list[str]] = []
     ui_labels: ClassVar[list[UILabel]] = []
     transforms_map: ClassVar[dict[str, list[tuple[SpecifierSet, dict[str, Callable]]]]] = defaultdict(list)
+    # find_transforms results by (entity_id, entity_version); reset on register
+    _resolved_transforms: ClassVar[dict[tuple[str, str], dict[str, Callable]]] = {}
 
     def __init__(cls, name: str, bases: tuple, attrs: dict):
         """Register Plugin subclasses automatically."""
@@ -151,6 +154,7 @@ class Registry(type):
         """
         if not entity_id or not transform_label:
             raise PluginError("register_transform requires entity_id and transform_label", ErrorCode.INVALID_INPUT)
+        cls._resolved_transforms.clear()
 
         try:
             spec = SpecifierSet(version_spec)
@@ -207,19 +211,26 @@ class Registry(type):
             entity_version: The entity version string
 
         Returns:
-            Dict mapping transform_label -> transform function
+            Dict mapping transform_label -> transform function. It is
+            shared between calls, so don't modify it.
         """
         if entity_id not in cls.transforms_map:
             return {}
+        key = (entity_id, entity_version)
+        result = cls._resolved_transforms.get(key)
+        if result is not None:
+            return result
+
+        result = {}
         try:
             ver = Version(entity_version)
         except InvalidVersion:
-            return {}
-
-        result: dict[str, Callable] = {}
-        for specset, mapping in cls.transforms_map.get(entity_id, []):
-            if ver in specset:
-                result.update(mapping)
+            pass
+        else:
+            for specset, mapping in cls.transforms_map.get(entity_id, []):
+                if ver in specset:
+                    result.update(mapping)
+        cls._resolved_transforms[key] = result
         return result
 
     @classmethod
@@ -290,9 +301,17 @@ class Plugin(object, metaclass=Registry):
     # Plugin-level dependencies (installed on plugin load)
     deps: list[str] = []
 
+    # Let the IPC worker and run_transform reuse one instance across runs
+    # (only safe when transforms keep no per-run state on self)
+    reusable: bool = False
+
     # Elements definition
     elements: ElementsLayout = []
 
+    # (version, element rows), set on each class by _element_rows. Only
+    # declared: a default here would be visible from every subclass
+    _blueprint_cache: ClassVar[tuple[str | None, list[dict | list[dict]]]]
+
     def __init__(self):
         """Initialize plugin instance and discover transforms."""
         transforms = self.__class__.__dict__.values()
@@ -329,6 +348,24 @@ class Plugin(object, metaclass=Registry):
                         element[t] = kwargs[label][t]
         return element
 
+    @classmethod
+    def _element_rows(cls) -> list[dict | list[dict]]:
+        """to_dict() of every element, built once per class and version.
+
+        Kept in the class's own __dict__ so subclasses never read a parent's
+        rows; blueprint() copies each row before filling in values.
+        """
+        cached = cls.__dict__.get('_blueprint_cache')
+        version = getattr(cls, 'version', None)
+        if cached is None or cached[0] != version:
+            rows = [
+                [elm.to_dict() for elm in element] if isinstance(element, list) else element.to_dict()
+                for element in cls.elements
+            ]
+            cached = (version, rows)
+            cls._blueprint_cache = cached
+        return cached[1]
+
     @classmethod
     def blueprint(cls, **kwargs) -> dict[str, Any]:
         """Generate a blueprint dict for this entity.
@@ -353,15 +390,14 @@ class Plugin(object, metaclass=Registry):
         if cls.tags:
             metaentity['tags'] = cls.tags
 
-        for element in cls.elements:
-            if isinstance(element, list):
+        for row in cls._element_rows():
+            if isinstance(row, list):
                 metaentity['elements'].append([
-                    cls.__map_element_labels(elm.to_dict(), **kwargs)
-                    for elm in element
+                    cls.__map_element_labels(elm.copy(), **kwargs)
+                    for elm in row
                 ])
             else:
-                element_row = cls.__map_element_labels(element.to_dict(), **kwargs)
-                metaentity['elements'].append(element_row)
+                metaentity['elements'].append(cls.__map_element_labels(row.copy(), **kwargs))
 
         return metaentity
 
@@ -412,7 +448,7 @@ class Plugin(object, metaclass=Registry):
                 deps = getattr(transform_fn, 'deps', None)
                 if deps:
                     from osintbuddy.deps import ensure_deps
-                    ensure_deps(tuple(deps))
+                    await asyncio.to_thread(ensure_deps, tuple(deps))
 
                 # Handle settings
                 settings = getattr(transform_fn, 'settings', None)
@@ -428,8 +464,7 @@ class Plugin(object, metaclass=Registry):
                     if errors:
                         raise PluginError(f"Config validation failed: {errors}", ErrorCode.CONFIG_INVALID)
 
-                sig = inspect.signature(transform_fn)
-                if 'cfg' in sig.parameters:
+                if transform_meta(transform_fn)["takes_cfg"]:
                     result = await transform_fn(
                         entity=TransformPayload(**entity),
                         cfg=cfg
@@ -493,6 +528,55 @@ class Plugin(object, metaclass=Registry):
         return field_types
 
 
+def load_entity_file(entity_path: str) -> None:
+    """Load one entity plugin file.
+
+    Installs the deps of the Plugin classes it defines (which register
+    themselves) and registers any transforms defined alongside them.
+    """
+    mod_name = entity_path.replace('.py', '').replace('plugins/', '').replace('entities/', '')
+    spec = importlib.util.spec_from_file_location(mod_name, entity_path)
+    if spec is not None and spec.loader is not None:
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[mod_name] = module
+        spec.loader.exec_module(module)
+
+        # Install plugin-level deps and register transforms
+        for name in dir(module):
+            obj = getattr(module, name)
+            if isinstance(obj, type) and issubclass(obj, Plugin) and obj is not Plugin:
+                if hasattr(obj, 'deps') and obj.deps:
+                    from osintbuddy.deps import ensure_deps
+                    ensure_deps(tuple(obj.deps))
+            # Also register transforms defined in entity files
+            elif callable(obj) and hasattr(obj, 'entity_transform') and hasattr(obj, 'entity_version'):
+                tlabel = to_snake_case(getattr(obj, 'label'))
+                entity_id = getattr(obj, 'entity_transform')
+                version_spec = getattr(obj, 'entity_version')
+                Registry.register_transform(entity_id, version_spec, tlabel, obj)
+
+
+def load_transform_file(script: str) -> None:
+    """Load one transform script as ``plugins.transforms.<name>`` and register its transforms."""
+    base = os.path.splitext(os.path.basename(script))[0]
+    script_mod_name = f"plugins.transforms.{base}"
+    spec = importlib.util.spec_from_file_location(script_mod_name, script)
+    if spec is not None and spec.loader is not None:
+        module = importlib.util.module_from_spec(spec)
+        module.__package__ = "plugins.transforms"
+        sys.modules[script_mod_name] = module
+        spec.loader.exec_module(module)
+
+        # Register transforms found in the module
+        for name in dir(module):
+            obj = getattr(module, name)
+            if callable(obj) and hasattr(obj, 'entity_transform') and hasattr(obj, 'entity_version'):
+                tlabel = to_snake_case(getattr(obj, 'label'))
+                entity_id = getattr(obj, 'entity_transform')
+                version_spec = getattr(obj, 'entity_version')
+                Registry.register_transform(entity_id, version_spec, tlabel, obj)
+
+
 def load_plugins_fs(plugins_path: str = "plugins", package: str = "osintbuddy.transforms") -> dict[str, type[Plugin]]:
     """Load plugins from filesystem.
 
@@ -507,55 +591,41 @@ def load_plugins_fs(plugins_path: str = "plugins", package: str = "osintbuddy.tr
     Returns:
         Dict of loaded plugins (entity_id -> Plugin class)
     """
-    entity_files = glob.glob(f'{plugins_path}/entities/*.py')
-    transform_scripts = glob.glob(f'{plugins_path}/transforms/*.py')
-
-    # Load entity plugins
-    for entity_path in entity_files:
-        mod_name = entity_path.replace('.py', '').replace('plugins/', '').replace('entities/', '')
-        spec = importlib.util.spec_from_file_location(mod_name, entity_path)
-        if spec is not None and spec.loader is not None:
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[mod_name] = module
-            spec.loader.exec_module(module)
-
-            # Install plugin-level deps and register transforms
-            for name in dir(module):
-                obj = getattr(module, name)
-                if isinstance(obj, type) and issubclass(obj, Plugin) and obj is not Plugin:
-                    if hasattr(obj, 'deps') and obj.deps:
-                        from osintbuddy.deps import ensure_deps
-                        ensure_deps(tuple(obj.deps))
-                # Also register transforms defined in entity files
-                elif callable(obj) and hasattr(obj, 'entity_transform') and hasattr(obj, 'entity_version'):
-                    tlabel = to_snake_case(getattr(obj, 'label'))
-                    entity_id = getattr(obj, 'entity_transform')
-                    version_spec = getattr(obj, 'entity_version')
-                    Registry.register_transform(entity_id, version_spec, tlabel, obj)
-
-    # Load transform scripts
-    for script in transform_scripts:
-        base = os.path.splitext(os.path.basename(script))[0]
-        script_mod_name = f"plugins.transforms.{base}"
-        spec = importlib.util.spec_from_file_location(script_mod_name, script)
-        if spec is not None and spec.loader is not None:
-            module = importlib.util.module_from_spec(spec)
-            module.__package__ = "plugins.transforms"
-            sys.modules[script_mod_name] = module
-            spec.loader.exec_module(module)
-
-            # Register transforms found in the module
-            for name in dir(module):
-                obj = getattr(module, name)
-                if callable(obj) and hasattr(obj, 'entity_transform') and hasattr(obj, 'entity_version'):
-                    tlabel = to_snake_case(getattr(obj, 'label'))
-                    entity_id = getattr(obj, 'entity_transform')
-                    version_spec = getattr(obj, 'entity_version')
-                    Registry.register_transform(entity_id, version_spec, tlabel, obj)
-
+    for entity_path in glob.glob(f'{plugins_path}/entities/*.py'):
+        load_entity_file(entity_path)
+    for script in glob.glob(f'{plugins_path}/transforms/*.py'):
+        load_transform_file(script)
     return Registry.plugins
 
 
+def _call_meta(fn: Callable) -> dict[str, bool]:
+    params = inspect.signature(fn).parameters
+    return {
+        "takes_cfg": "cfg" in params,
+        # Pass the plugin instance as ``self`` (also into **kwargs)
+        "needs_self": "self" in params or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+        ),
+    }
+
+
+def transform_meta(fn: Callable) -> dict[str, bool]:
+    """How to call a transform, read from its signature once.
+
+    ``@transform`` stores this as ``__ob_meta__``; other callables get it
+    computed on first use and attached when possible.
+    """
+    try:
+        meta: dict[str, bool] = fn.__ob_meta__  # type: ignore[attr-defined]
+    except AttributeError:
+        meta = _call_meta(fn)
+        try:
+            fn.__ob_meta__ = meta  # type: ignore[attr-defined]
+        except (AttributeError, TypeError):
+            pass
+    return meta
+
+
 def transform(
     target: str,
     label: str,
@@ -607,10 +677,10 @@ def transform(
         if inspect.isasyncgenfunction(func):
             @functools.wraps(func)
             async def wrapper(entity: Any, **kwargs: Any) -> Any:
-                # Install dependencies if specified
+                # Install dependencies if specified, off the event loop
                 if deps:
                     from osintbuddy.deps import ensure_deps
-                    ensure_deps(tuple(deps))
+                    await asyncio.to_thread(ensure_deps, tuple(deps))
                 async for item in func(entity=entity, **kwargs):
                     yield item
         elif inspect.isgeneratorfunction(func):
@@ -623,13 +693,15 @@ def transform(
         else:
             @functools.wraps(func)
             async def wrapper(entity: Any, **kwargs: Any) -> Any:
-                # Install dependencies if specified
+                # Install dependencies if specified, off the event loop
                 if deps:
                     from osintbuddy.deps import ensure_deps
-                    ensure_deps(tuple(deps))
+                    await asyncio.to_thread(ensure_deps, tuple(deps))
                 if inspect.iscoroutinefunction(func):
                     return await func(entity=entity, **kwargs)
-                return func(entity=entity, **kwargs)
+                # A sync transform blocks, so it gets a worker thread; the
+                # context (and with it the progress callback) goes along
+                return await asyncio.to_thread(func, entity=entity, **kwargs)
 
         # Attach metadata to wrapper
         wrapper.label = label
@@ -642,6 +714,7 @@ def transform(
         wrapper.transform_set = transform_set
         wrapper.accepts = accepts or []
         wrapper.produces = produces or []
+        wrapper.__ob_meta__ = _call_meta(func)  # type: ignore[attr-defined]
 
         return wrapper
 
@@ -34,6 +34,7 @@ Example usage:
 """
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
@@ -174,13 +175,85 @@ class Subgraph:
         }
 
 
-def normalize_result(result: Any, default_edge_label: str = "") -> list[dict[str, Any]]:
+class RawJSON:
+    """A result item that is already serialized JSON.
+
+    Output writers embed ``data`` as-is instead of re-encoding it, so
+    transforms passing upstream JSON through (e.g.
+    ``RawJSON(response.content)``) skip a parse and re-encode. The bytes
+    aren't validated, and normalize_result passes the item through
+    untouched, so include ``edge_label`` yourself if you need one.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes | str):
+        self.data = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.data!r})"
+
+
+def _normalize_entity(item: Entity, default_edge_label: str) -> dict[str, Any]:
+    entity_dict = item.to_dict()
+    # Apply default edge label if not overridden
+    if "edge_label" not in entity_dict:
+        entity_dict["edge_label"] = default_edge_label
+    return entity_dict
+
+
+def _normalize_subgraph(item: Subgraph, default_edge_label: str) -> dict[str, Any]:
+    return item.to_dict()
+
+
+def _normalize_dict(item: dict, default_edge_label: str) -> dict[str, Any]:
+    # Legacy dict format - ensure edge_label exists
+    if "edge_label" not in item:
+        item["edge_label"] = default_edge_label
+    return item
+
+
+def _normalize_raw(item: RawJSON, default_edge_label: str) -> RawJSON:
+    return item
+
+
+def _normalize_other(item: Any, default_edge_label: str) -> dict[str, Any] | RawJSON | None:
+    # Subclasses of the known types
+    if isinstance(item, RawJSON):
+        return item
+    if isinstance(item, Entity):
+        return _normalize_entity(item, default_edge_label)
+    if isinstance(item, Subgraph):
+        return _normalize_subgraph(item, default_edge_label)
+    if isinstance(item, dict):
+        return _normalize_dict(item, default_edge_label)
+    # Try to convert to dict
+    try:
+        return dict(item)
+    except (TypeError, ValueError):
+        # Skip unconvertible items
+        return None
+
+
+# Exact-type dispatch for result items; anything else goes to _normalize_other
+_Normalizer = Callable[[Any, str], dict[str, Any] | RawJSON | None]
+
+_NORMALIZERS: dict[type, _Normalizer] = {
+    dict: _normalize_dict,
+    Entity: _normalize_entity,
+    Subgraph: _normalize_subgraph,
+    RawJSON: _normalize_raw,
+}
+
+
+def normalize_result(result: Any, default_edge_label: str = "") -> list[dict[str, Any] | RawJSON]:
     """Normalize transform result to a list of dicts.
 
     Handles:
     - Plain dicts (legacy format)
     - Entity instances
     - Subgraph instances
+    - RawJSON items, passed through unchanged
     - Lists of any of the above
 
     Args:
@@ -188,7 +261,7 @@ def normalize_result(result: Any, default_edge_label: str = "") -> list[dict[str
         default_edge_label: Default edge label from transform decorator
 
     Returns:
-        List of normalized entity dicts ready for JSON serialization
+        List of normalized entity dicts (and RawJSON items) ready for JSON serialization
     """
     if result is None:
         return []
@@ -202,26 +275,10 @@ def normalize_result(result: Any, default_edge_label: str = "") -> list[dict[str
         result = [result]
 
     normalized = []
+    get_normalizer = _NORMALIZERS.get
     for item in result:
-        if isinstance(item, Entity):
-            entity_dict = item.to_dict()
-            # Apply default edge label if not overridden
-            if "edge_label" not in entity_dict:
-                entity_dict["edge_label"] = default_edge_label
-            normalized.append(entity_dict)
-        elif isinstance(item, Subgraph):
-            normalized.append(item.to_dict())
-        elif isinstance(item, dict):
-            # Legacy dict format - ensure edge_label exists
-            if "edge_label" not in item:
-                item["edge_label"] = default_edge_label
-            normalized.append(item)
-        else:
-            # Try to convert to dict
-            try:
-                normalized.append(dict(item))
-            except (TypeError, ValueError):
-                # Skip unconvertible items
-                pass
+        entry = get_normalizer(type(item), _normalize_other)(item, default_edge_label)
+        if entry is not None:
+            normalized.append(entry)
 
     return normalized
@@ -8,6 +8,7 @@ from pydantic import EmailStr
 
 from typing import Generator
 from contextlib import contextmanager
+from functools import lru_cache
 
 from selenium import webdriver
 from selenium.webdriver.chrome.webdriver import WebDriver
@@ -132,6 +133,8 @@ def to_camel_case(value: str):
     return value_list[0] + ''.join(e.title() for e in value_list[1:])
 
 
+# Labels and payload keys repeat on every IPC request
+@lru_cache(maxsize=4096)
 def to_snake_case(name):
     name = to_camel_case(name.replace('-', '_'))
     name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
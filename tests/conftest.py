@@ -0,0 +1,55 @@
+"""Shared fixtures: a clean Registry and throwaway plugin directories."""
+from __future__ import annotations
+
+import textwrap
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import osintbuddy.ob as ob
+from osintbuddy.plugins import Registry
+
+ENTITY_SOURCE = '''
+import osintbuddy as ob
+from osintbuddy.elements import TextInput
+
+
+class {name}(ob.Plugin):
+    version = "1.0.0"
+    label = "{label}"
+    elements = [TextInput(label="Name")]
+'''
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Give every test an empty Registry and leave one behind."""
+    ob._clear_registry()
+    Registry._resolved_transforms.clear()
+    yield
+    ob._clear_registry()
+    Registry._resolved_transforms.clear()
+
+
+@pytest.fixture
+def make_plugins(tmp_path: Path) -> Callable[..., Path]:
+    """Write a plugins directory: ``entities`` maps class name -> label,
+    ``transforms`` maps file name -> module source."""
+
+    def make(
+        entities: dict[str, str],
+        transforms: dict[str, str] | None = None,
+        name: str = "plugins",
+    ) -> Path:
+        root = tmp_path / name
+        (root / "entities").mkdir(parents=True, exist_ok=True)
+        (root / "transforms").mkdir(exist_ok=True)
+        for cls_name, label in entities.items():
+            source = ENTITY_SOURCE.format(name=cls_name, label=label)
+            (root / "entities" / f"{cls_name.lower()}.py").write_text(source)
+        for file_name, source in (transforms or {}).items():
+            (root / "transforms" / file_name).write_text(textwrap.dedent(source))
+        return root
+
+    return make
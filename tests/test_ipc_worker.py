@@ -0,0 +1,236 @@
+"""The IPC worker driven over real pipes, the way the app talks to it."""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from osintbuddy import ipc_worker
+from osintbuddy.ipc_worker import AsyncIpcChannel, IpcChannel, ObWorker
+
+pytestmark = pytest.mark.unit
+
+SLOW_TRANSFORMS = '''
+import time
+
+import osintbuddy as ob
+from osintbuddy.output import emit_progress
+
+
+@ob.transform(target="slow_entity@1.0.0", label="Blocking")
+def blocking(entity):
+    for step in range(3):
+        time.sleep(0.2)
+        emit_progress(f"step {step}", (step + 1) * 30)
+    return [{"label": "Slow Entity", "n": 1}]
+'''
+
+
+class Peer:
+    """The app's end of the pipes: sends requests, timestamps every reply."""
+
+    def __init__(self) -> None:
+        req_r, self._req_w = os.pipe()
+        resp_r, resp_w = os.pipe()
+        self.worker_channel = AsyncIpcChannel(req_r, resp_w)
+        self._client = IpcChannel(resp_r, self._req_w)
+        self._resp_w = resp_w
+        self.replies: list[tuple[float, dict[str, Any]]] = []
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self) -> None:
+        while (message := self._client.recv()) is not None:
+            if message.get("id") == "hello" and message.get("event") == "response":
+                # The worker answers hello in the old codec, then switches
+                self._client.use_codec(message["payload"]["codec"])
+            self.replies.append((time.monotonic(), message))
+
+    def send(self, message: dict[str, Any]) -> None:
+        self._client.send(message)
+
+    def hang_up(self) -> None:
+        os.close(self._req_w)
+
+    def close(self) -> None:
+        os.close(self._resp_w)
+        self._reader.join(timeout=5)
+
+    def events(self, req_id: str) -> list[tuple[float, dict[str, Any]]]:
+        return [(t, m) for t, m in self.replies if m.get("id") == req_id]
+
+
+@asynccontextmanager
+async def serving(peer: Peer, worker: ObWorker | None = None) -> AsyncIterator[None]:
+    """Run the worker's serve loop on ``peer`` until the block exits."""
+    serve = asyncio.create_task(ipc_worker._serve(peer.worker_channel, worker or ObWorker()))
+    try:
+        yield
+    finally:
+        peer.hang_up()
+        await asyncio.wait_for(serve, 5)
+        peer.close()
+
+
+async def finished(peer: Peer, ids: set[str]) -> None:
+    """Wait until every request in ``ids`` has had its final event."""
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        done = {m["id"] for _, m in peer.replies if m.get("event") in ("response", "done", "error")}
+        if ids <= done:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def exchange(peer: Peer, messages: list[dict[str, Any]], worker: ObWorker | None = None) -> None:
+    """Serve ``messages`` until every one of them has finished."""
+    async with serving(peer, worker):
+        for message in messages:
+            peer.send(message)
+        await finished(peer, {message["id"] for message in messages})
+
+
+def transform_message(req_id: str, transform: str, label: str, plugins_path: str) -> dict[str, Any]:
+    return {
+        "id": req_id,
+        "type": "transform",
+        "payload": {
+            "source": {"transform": transform, "label": label, "data": {}},
+            "pluginsPath": plugins_path,
+        },
+    }
+
+
+async def test_progress_from_blocking_transform_arrives_as_it_happens(make_plugins):
+    plugins = make_plugins({"SlowEntity": "Slow Entity"}, {"slow.py": SLOW_TRANSFORMS})
+    peer = Peer()
+    await exchange(peer, [transform_message("1", "Blocking", "Slow Entity", str(plugins))])
+
+    events = peer.events("1")
+    kinds = [m["event"] for _, m in events]
+    assert kinds == ["progress"] * 4 + ["result", "done"]
+    messages = [m["payload"]["message"] for _, m in events if m["event"] == "progress"]
+    assert messages == ["Starting transform", "step 0", "step 1", "step 2"]
+
+    arrived = {m["payload"].get("message"): t for t, m in events if m["event"] == "progress"}
+    done_at = events[-1][0]
+    # Each step was written while the transform was still sleeping
+    assert done_at - arrived["step 0"] >= 0.3
+    assert arrived["step 1"] - arrived["step 0"] >= 0.1
+
+
+async def test_blocking_transform_leaves_the_loop_free(make_plugins):
+    plugins = make_plugins({"SlowEntity": "Slow Entity"}, {"slow.py": SLOW_TRANSFORMS})
+    worker = ObWorker()
+    worker.ensure_plugins(str(plugins))
+    peer = Peer()
+    await exchange(peer, [
+        transform_message("slow", "Blocking", "Slow Entity", str(plugins)),
+        {"id": "list", "type": "entities", "payload": {"pluginsPath": str(plugins)}},
+    ], worker)
+
+    listed_at, listed = peer.events("list")[0]
+    assert listed["event"] == "response"
+    assert [e["label"] for e in listed["payload"]] == ["Slow Entity"]
+    assert listed_at < peer.events("slow")[-1][0]
+
+
+async def test_switching_plugins_is_refused_while_a_transform_runs(make_plugins):
+    plugins = make_plugins({"SlowEntity": "Slow Entity"}, {"slow.py": SLOW_TRANSFORMS})
+    other = make_plugins({"OtherEntity": "Other Entity"}, name="other")
+    peer = Peer()
+    await exchange(peer, [
+        transform_message("slow", "Blocking", "Slow Entity", str(plugins)),
+        {"id": "other", "type": "entities", "payload": {"pluginsPath": str(other)}},
+    ])
+
+    (_, refused), = peer.events("other")
+    assert refused["event"] == "error"
+    assert refused["payload"]["code"] == "PLUGIN_LOAD_ERROR"
+    assert [m["event"] for _, m in peer.events("slow")][-2:] == ["result", "done"]
+
+
+async def test_hello_switches_both_ends_to_msgpack(make_plugins):
+    pytest.importorskip("ormsgpack")
+    plugins = make_plugins({"SlowEntity": "Slow Entity"})
+    peer = Peer()
+    async with serving(peer):
+        peer.send({"id": "hello", "type": "hello", "payload": {"codecs": ["msgpack", "json"]}})
+        await finished(peer, {"hello"})
+        peer.send({"id": "list", "type": "entities", "payload": {"pluginsPath": str(plugins)}})
+        await finished(peer, {"list"})
+
+    (_, hello), = peer.events("hello")
+    assert hello["payload"]["codec"] == "msgpack"
+    assert peer.worker_channel.codec == "msgpack"
+    (_, listed), = peer.events("list")
+    assert [e["label"] for e in listed["payload"]] == ["Slow Entity"]
+
+
+async def test_hello_falls_back_to_json_without_msgpack(monkeypatch):
+    monkeypatch.setattr(ipc_worker, "_CODECS", {"json": ipc_worker._CODECS["json"]})
+    peer = Peer()
+    async with serving(peer):
+        peer.send({"id": "hello", "type": "hello", "payload": {"codecs": ["msgpack"]}})
+        await finished(peer, {"hello"})
+
+    (_, hello), = peer.events("hello")
+    assert hello["payload"] == {"codec": "json", "codecs": ["json"]}
+    assert peer.worker_channel.codec == "json"
+
+
+def test_payloads_decode_from_json_or_msgpack():
+    assert ipc_worker._decode_payload('{"a": 1}') == {"a": 1}
+    assert ipc_worker._decode_payload(b' [1, 2]') == [1, 2]
+    ormsgpack = pytest.importorskip("ormsgpack")
+    assert ipc_worker._decode_payload(ormsgpack.packb({"a": 1})) == {"a": 1}
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    """An AsyncIpcChannel whose real writes are recorded as frame counts."""
+    writes: list[int] = []
+    monkeypatch.setattr(IpcChannel, "_write", lambda self, buffers: writes.append(len(buffers) // 2))
+    req_r, req_w = os.pipe()
+    resp_r, resp_w = os.pipe()
+    channel = AsyncIpcChannel(req_r, resp_w)
+    yield channel, writes
+    for fd in (req_w, resp_r, resp_w):
+        os.close(fd)
+    channel._reader.close()
+
+
+async def test_outbox_batches_frames_until_the_loop_turn_ends(outbox):
+    channel, writes = outbox
+    for n in range(3):
+        channel.send({"id": "1", "event": "result", "payload": n})
+    assert writes == []
+    await asyncio.sleep(0)
+    assert writes == [3]
+
+
+async def test_outbox_flushes_progress_immediately(outbox):
+    channel, writes = outbox
+    channel.send({"id": "1", "event": "result", "payload": 0})
+    channel.send({"id": "1", "event": "progress", "payload": {"message": "half", "percent": 50}})
+    # The queued result goes out with the progress, in order
+    assert writes == [2]
+
+
+async def test_outbox_writes_sends_from_other_threads_at_once(outbox):
+    channel, writes = outbox
+    await asyncio.to_thread(channel.send, {"id": "1", "event": "result", "payload": 0})
+    assert writes == [1]
+
+
+async def test_outbox_flushes_early_when_full(outbox):
+    channel, writes = outbox
+    frames = ipc_worker._OUTBOX_MAX_BUFFERS // 2
+    channel.send_many([{"id": "1", "event": "result", "payload": n} for n in range(frames)])
+    assert writes == [frames]
@@ -0,0 +1,185 @@
+"""Structured output: delimited results, errors and progress ordering."""
+from __future__ import annotations
+
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+
+import pytest
+
+from osintbuddy.ob import _stream_items
+from osintbuddy.output import (
+    ERROR_END,
+    ERROR_START,
+    JSON_END,
+    JSON_START,
+    PROGRESS_BACKLOG,
+    PROGRESS_PREFIX,
+    emit_error,
+    emit_progress,
+    emit_result_astream,
+    emit_result_stream,
+    flush_progress,
+)
+from osintbuddy.results import RawJSON, normalize_result
+
+pytestmark = pytest.mark.unit
+
+
+@contextmanager
+def console() -> Iterator[io.StringIO]:
+    """stdout and stderr as one stream, so their relative order shows.
+
+    Entered in the test body: pytest reinstalls its own capture streams
+    after fixtures have run.
+    """
+    stream = io.StringIO()
+    with redirect_stdout(stream), redirect_stderr(stream):
+        try:
+            yield stream
+        finally:
+            flush_progress()
+
+
+def blocks(text: str, start: str, end: str) -> list[object]:
+    """Every JSON document between start and end delimiters, in order.
+
+    Progress lines are stripped first; on a shared stream they can land
+    between two batches of a list.
+    """
+    text = re.sub(re.escape(PROGRESS_PREFIX) + r".*\n", "", text)
+    found = []
+    for chunk in text.split(start)[1:]:
+        found.append(json.loads(chunk.split(end, 1)[0]))
+    return found
+
+
+def test_progress_is_written_before_the_batch_after_it():
+    def items():
+        for n in range(3):
+            emit_progress(f"step {n}", n)
+            yield {"n": n}
+
+    with console() as stream:
+        assert emit_result_stream(items(), flush_every=2) == 3
+    text = stream.getvalue()
+    assert text.index("step 1") < text.index(JSON_START) < text.index("step 2") < text.index(JSON_END)
+    assert blocks(text, JSON_START, JSON_END) == [[{"n": 0}, {"n": 1}, {"n": 2}]]
+
+
+def test_error_before_the_first_batch_writes_only_the_error():
+    def items():
+        yield {"n": 0}
+        raise ValueError("broken")
+
+    with console() as stream:
+        with pytest.raises(ValueError):
+            emit_result_stream(items(), flush_every=2)
+        emit_error("broken", "UNKNOWN")
+    text = stream.getvalue()
+    assert JSON_START not in text
+    assert blocks(text, ERROR_START, ERROR_END) == [{"error": "broken", "code": "UNKNOWN"}]
+
+
+def test_error_after_a_batch_closes_the_partial_list():
+    def items():
+        yield from ({"n": n} for n in range(3))
+        raise ValueError("broken")
+
+    with console() as stream:
+        with pytest.raises(ValueError):
+            emit_result_stream(items(), flush_every=2)
+        emit_error("broken", "UNKNOWN")
+    text = stream.getvalue()
+    assert blocks(text, JSON_START, JSON_END) == [[{"n": 0}, {"n": 1}, {"n": 2}]]
+    assert text.index(JSON_END) < text.index(ERROR_START)
+
+
+async def test_streamed_transform_reports_complete_before_the_result_ends():
+    async def transform():
+        yield {"label": "Example", "n": 1}
+
+    with console() as stream:
+        count = await emit_result_astream(_stream_items(transform(), "edge", complete=True))
+    assert count == 1
+    text = stream.getvalue()
+    assert text.index('"Complete"') < text.index(JSON_END)
+
+
+class GatedStream:
+    """A text stream whose writes wait for ``gate``, to pile up a backlog."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+
+    def write(self, text: str) -> None:
+        self.entered.set()
+        self.gate.wait(5)
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def test_progress_is_written_by_a_daemon_thread():
+    with console():
+        emit_progress("hello", 1)
+    writers = [t for t in threading.enumerate() if t.name == "osib-progress"]
+    assert len(writers) == 1
+    assert writers[0].daemon
+
+
+def test_progress_backlog_collapses_to_the_newest_line():
+    stream = GatedStream()
+    with redirect_stderr(stream):
+        emit_progress("first", 0)
+        assert stream.entered.wait(5)
+        # The writer is stuck on "first"; everything after it piles up
+        for n in range(PROGRESS_BACKLOG + 10):
+            emit_progress(f"queued {n}", n)
+        stream.gate.set()
+        flush_progress()
+    messages = [json.loads(line.removeprefix(PROGRESS_PREFIX))["message"] for line in stream.lines]
+    assert messages == ["first", f"queued {PROGRESS_BACKLOG + 9}"]
+
+
+def test_progress_still_queued_at_exit_is_written():
+    code = "from osintbuddy.output import emit_progress\nemit_progress('bye', 100)\n"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=30,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert proc.returncode == 0
+    assert f'{PROGRESS_PREFIX}{{"message":"bye","percent":100}}' in proc.stderr.replace(" ", "")
+
+
+def test_raw_json_items_are_passed_through():
+    raw = RawJSON(b'{"label": "Upstream",  "kept": "as is"}')
+    normalized = normalize_result([raw, {"label": "Plain"}], default_edge_label="edge")
+    assert normalized[0] is raw
+    assert normalized[1] == {"label": "Plain", "edge_label": "edge"}
+
+    with console() as stream:
+        emit_result_stream(normalized)
+    # The bytes are spliced in untouched, spacing and all
+    assert '[{"label": "Upstream",  "kept": "as is"},' in stream.getvalue()
+
+
+async def test_async_stream_error_closes_the_partial_list():
+    async def items():
+        for n in range(3):
+            yield {"n": n}
+        raise ValueError("broken")
+
+    with console() as stream:
+        with pytest.raises(ValueError):
+            await emit_result_astream(items(), flush_every=2)
+    assert blocks(stream.getvalue(), JSON_START, JSON_END) == [[{"n": 0}, {"n": 1}, {"n": 2}]]
@@ -0,0 +1,105 @@
+"""The registry snapshot cache and the transform lookup memo."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import osintbuddy.ob as ob
+from osintbuddy.plugins import Registry
+
+pytestmark = pytest.mark.unit
+
+TRANSFORMS = '''
+import osintbuddy as ob
+
+
+@ob.transform(target="cached_entity@1.0.0", label="To Other")
+def to_other(entity):
+    return []
+
+
+@ob.transform(target="other_entity@1.0.0", label="To Cached")
+def to_cached(entity):
+    return []
+
+
+@ob.transform(target="other_entity@1.0.0", label="Back Again")
+def back_again(entity):
+    return []
+'''
+
+
+@pytest.fixture
+def plugins(make_plugins, tmp_path, monkeypatch):
+    monkeypatch.setattr(ob, "REGISTRY_CACHE_DIR", tmp_path / "cache")
+    return make_plugins(
+        {"CachedEntity": "Cached Entity", "OtherEntity": "Other Entity"},
+        {"links.py": TRANSFORMS},
+    )
+
+
+def snapshot_loads_plugins(plugins_path) -> bool:
+    """Take a snapshot from a clean registry; True if it had to import the plugins."""
+    ob._clear_registry()
+    snapshot = ob.load_registry_snapshot(str(plugins_path))
+    assert set(snapshot["entities"]) == {"cached_entity", "other_entity"}
+    return bool(Registry.plugins)
+
+
+def test_snapshot_is_built_once_then_reused(plugins):
+    assert snapshot_loads_plugins(plugins)
+    assert list((plugins.parent / "cache").glob("registry-*.json"))
+    assert not snapshot_loads_plugins(plugins)
+
+
+def test_snapshot_lists_entities_and_their_transforms(plugins):
+    snapshot = ob.load_registry_snapshot(str(plugins))
+    assert snapshot["transform_count"] == 3
+    entity = snapshot["entities"]["other_entity"]
+    assert sorted(t["label"] for t in entity["transforms"]) == ["Back Again", "To Cached"]
+    assert [os.path.basename(m) for m in entity["modules"]] == ["otherentity.py", "links.py"]
+
+
+def test_snapshot_is_rebuilt_when_a_helper_file_changes(plugins):
+    helper = plugins / "helpers.py"
+    helper.write_text("KEY = 1\n")
+    assert snapshot_loads_plugins(plugins)
+    stat = helper.stat()
+    os.utime(helper, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert snapshot_loads_plugins(plugins)
+
+
+def test_snapshot_is_rebuilt_when_a_file_is_added(plugins):
+    assert snapshot_loads_plugins(plugins)
+    (plugins / "data.txt").write_text("new\n")
+    assert snapshot_loads_plugins(plugins)
+
+
+def test_corrupt_snapshot_is_rebuilt(plugins):
+    assert snapshot_loads_plugins(plugins)
+    (cache_file,) = (plugins.parent / "cache").glob("registry-*.json")
+    cache_file.write_text("{not json")
+    assert snapshot_loads_plugins(plugins)
+    assert not snapshot_loads_plugins(plugins)
+
+
+def test_partial_entity_run_counts_the_whole_directory(plugins):
+    ob.load_registry_snapshot(str(plugins))
+    ob._clear_registry()
+    assert ob.prepare_entity_run("Cached Entity", str(plugins)) == (2, 3)
+    # Only the entity's own module and its transforms were imported
+    assert set(Registry.plugins) == {"cached_entity"}
+
+
+def test_register_transform_invalidates_resolved_transforms():
+    def first(entity):
+        return []
+
+    def second(entity):
+        return []
+
+    Registry.register_transform("memo_entity", ">=1.0", "First", first)
+    assert list(Registry.find_transforms("memo_entity", "1.2.0")) == ["First"]
+    Registry.register_transform("memo_entity", "==1.2.0", "Second", second)
+    assert Registry.find_transforms("memo_entity", "1.2.0") == {"First": first, "Second": second}